@@ -13,6 +13,7 @@ from src.rule_generator import (
     RuleWizard,
     evaluate_rule,
     load_rules,
+    prepare_transactions,
     save_rules,
     validate_rule_block,
     validate_rules_document,
@@ -309,7 +310,8 @@ def run_dry_run(args, print_fn=print):
     if not args.transactions:
         raise SystemExit("--transactions is required for --dry-run")
     rules_doc = load_rules(args.rules_path)
-    transactions = json.loads(Path(args.transactions).read_text(encoding="utf-8"))
+    # Every rule runs over the same rows: normalize their fields once for all of them.
+    transactions = prepare_transactions(json.loads(Path(args.transactions).read_text(encoding="utf-8")))
     for idx, rule in enumerate(rules_doc.get("_rules", [])):
         report = evaluate_rule(rule, transactions, expected_matches=None)
         print_fn(f"Rule #{idx} {rule.get('category_name')}: matches={len(report['matches'])}")
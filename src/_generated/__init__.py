@@ -0,0 +1,50 @@
+"""Ahead-of-time fastjsonschema validators for the schemas shipped in config/schemas.
+
+Regenerate after editing a schema with ``python -m src._generated``; CI runs
+``python -m src._generated --check`` to catch stale files. Each module records
+the digest of the schema it was built from, so a stale module is never used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+# generated module name -> schema it is built from
+SCHEMAS: Dict[str, Path] = {
+    "_rule_validator": Path("config") / "schemas" / "rule_schema.json",
+    "_profile_validator": Path("config") / "schemas" / "bank_profile_schema.json",
+}
+
+
+def schema_digest(schema: Dict[str, Any]) -> str:
+    """Stable digest of a schema's content (key order does not matter)."""
+
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _load_pregenerated() -> Dict[str, Callable[[Any], Any]]:
+    validators: Dict[str, Callable[[Any], Any]] = {}
+    for module_name in SCHEMAS:
+        try:
+            module = importlib.import_module(f"{__name__}.{module_name}")
+        except ImportError:
+            # Not generated yet, or fastjsonschema (which the code imports) is missing.
+            continue
+        validators[module.SCHEMA_SHA256] = module.validate
+    return validators
+
+
+_PREGENERATED: Optional[Dict[str, Callable[[Any], Any]]] = None
+
+
+def get_pregenerated_validator(digest: str) -> Optional[Callable[[Any], Any]]:
+    """Return the pregenerated validate() for a schema digest, if one is shipped."""
+
+    global _PREGENERATED
+    if _PREGENERATED is None:
+        _PREGENERATED = _load_pregenerated()
+    return _PREGENERATED.get(digest)
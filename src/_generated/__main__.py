@@ -0,0 +1,55 @@
+"""Regenerate (or with --check, verify) the pregenerated schema validators."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import fastjsonschema
+
+from . import SCHEMAS, schema_digest
+
+# Validators only check documents; they must never write schema defaults into them.
+# Used for both regeneration and --check, so the shipped files can't drift from it.
+COMPILE_OPTIONS = {"use_default": False}
+
+HEADER = '''# Generated by `python -m src._generated` from {schema}. Do not edit.
+SCHEMA_SHA256 = "{digest}"
+'''
+
+
+def render(schema_path: Path) -> str:
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    code = fastjsonschema.compile_to_code(schema, **COMPILE_OPTIONS)
+    return HEADER.format(schema=schema_path.as_posix(), digest=schema_digest(schema)) + code
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--check", action="store_true", help="fail if any generated file is out of date")
+    args = parser.parse_args(argv)
+
+    out_dir = Path(__file__).parent
+    stale = []
+    for module_name, schema_path in SCHEMAS.items():
+        target = out_dir / f"{module_name}.py"
+        expected = render(schema_path)
+        current = target.read_text(encoding="utf-8") if target.exists() else None
+        if current == expected:
+            continue
+        if args.check:
+            stale.append(target)
+        else:
+            target.write_text(expected, encoding="utf-8")
+            print(f"Wrote {target}")
+
+    if stale:
+        print("Out of date (run `python -m src._generated`): " + ", ".join(str(p) for p in stale))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+# Generated by `python -m src._generated` from config/schemas/bank_profile_schema.json. Do not edit.
+SCHEMA_SHA256 = "47a23055ee5f73fd9c63a20bc4bf19a75411de7a54aab59938a022139aace5c7"
+VERSION = "2.22.2"
+from decimal import Decimal
+import re
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+REGEX_PATTERNS = {
+    '^[a-zA-Z0-9_]+$': re.compile('^[a-zA-Z0-9_]+$')
+}
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'Bank Profile Schema', 'type': 'object', 'required': ['bank_name', 'sections'], 'properties': {'bank_name': {'type': 'string', 'description': 'Human-readable name of the bank/card'}, 'sections': {'type': 'array', 'description': 'List of sections to parse from PDF', 'items': {'type': 'object', 'required': ['section_name', 'match_text', 'columns'], 'properties': {'section_name': {'type': 'string', 'description': 'Logical name of the section (e.g., Purchases, Payments)'}, 'match_text': {'type': 'string', 'description': 'Anchor text in PDF to identify section'}, 'columns': {'type': 'object', 'description': 'Mapping of field names to column indices', 'patternProperties': {'^[a-zA-Z0-9_]+$': {'type': 'integer', 'minimum': 0}}, 'minProperties': 1}, 'skip_footer_rows': {'type': 'boolean', 'default': False}}}}, 'csv_format': {'type': 'object', 'description': 'Optional CSV ingestion rules', 'required': ['date_format', 'columns'], 'properties': {'date_format': {'type': 'string', 'enum': ['YYYY-MM-DD', 'MM/DD/YYYY'], 'description': 'Date format used in CSV export'}, 'columns': {'type': 'object', 'description': 'Mapping of CSV fields to column indices', 'patternProperties': {'^[a-zA-Z0-9_]+$': {'type': 'integer', 'minimum': 0}}, 'minProperties': 1}, 'skip_footer_rows': {'type': 'boolean', 'default': False}}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['bank_name', 'sections']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'title': 'Bank Profile Schema', 'type': 'object', 'required': ['bank_name', 'sections'], 'properties': {'bank_name': {'type': 'string', 'description': 'Human-readable name of the bank/card'}, 'sections': {'type': 'array', 'description': 'List of sections to parse from PDF', 'items': {'type': 'object', 'required': ['section_name', 'match_text', 'columns'], 'properties': {'section_name': {'type': 'string', 'description': 'Logical name of the section (e.g., Purchases, Payments)'}, 'match_text': {'type': 'string', 'description': 'Anchor text in PDF to identify section'}, 'columns': {'type': 'object', 'description': 'Mapping of field names to column indices', 'patternProperties': {'^[a-zA-Z0-9_]+$': {'type': 'integer', 'minimum': 0}}, 'minProperties': 1}, 'skip_footer_rows': {'type': 'boolean', 'default': False}}}}, 'csv_format': {'type': 'object', 'description': 'Optional CSV ingestion rules', 'required': ['date_format', 'columns'], 'properties': {'date_format': {'type': 'string', 'enum': ['YYYY-MM-DD', 'MM/DD/YYYY'], 'description': 'Date format used in CSV export'}, 'columns': {'type': 'object', 'description': 'Mapping of CSV fields to column indices', 'patternProperties': {'^[a-zA-Z0-9_]+$': {'type': 'integer', 'minimum': 0}}, 'minProperties': 1}, 'skip_footer_rows': {'type': 'boolean', 'default': False}}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "bank_name" in data_keys:
+            data_keys.remove("bank_name")
+            data__bankname = data["bank_name"]
+            if not isinstance(data__bankname, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".bank_name must be string", value=data__bankname, name="" + (name_prefix or "data") + ".bank_name", definition={'type': 'string', 'description': 'Human-readable name of the bank/card'}, rule='type')
+        if "sections" in data_keys:
+            data_keys.remove("sections")
+            data__sections = data["sections"]
+            if not isinstance(data__sections, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections must be array", value=data__sections, name="" + (name_prefix or "data") + ".sections", definition={'type': 'array', 'description': 'List of sections to parse from PDF', 'items': {'type': 'object', 'required': ['section_name', 'match_text', 'columns'], 'properties': {'section_name': {'type': 'string', 'description': 'Logical name of the section (e.g., Purchases, Payments)'}, 'match_text': {'type': 'string', 'description': 'Anchor text in PDF to identify section'}, 'columns': {'type': 'object', 'description': 'Mapping of field names to column indices', 'patternProperties': {'^[a-zA-Z0-9_]+$': {'type': 'integer', 'minimum': 0}}, 'minProperties': 1}, 'skip_footer_rows': {'type': 'boolean', 'default': False}}}}, rule='type')
+            data__sections_is_list = isinstance(data__sections, (list, tuple))
+            if data__sections_is_list:
+                data__sections_len = len(data__sections)
+                for data__sections_x, data__sections_item in enumerate(data__sections):
+                    if not isinstance(data__sections_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}]".format(**locals()) + " must be object", value=data__sections_item, name="" + (name_prefix or "data") + ".sections[{data__sections_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['section_name', 'match_text', 'columns'], 'properties': {'section_name': {'type': 'string', 'description': 'Logical name of the section (e.g., Purchases, Payments)'}, 'match_text': {'type': 'string', 'description': 'Anchor text in PDF to identify section'}, 'columns': {'type': 'object', 'description': 'Mapping of field names to column indices', 'patternProperties': {'^[a-zA-Z0-9_]+$': {'type': 'integer', 'minimum': 0}}, 'minProperties': 1}, 'skip_footer_rows': {'type': 'boolean', 'default': False}}}, rule='type')
+                    data__sections_item_is_dict = isinstance(data__sections_item, dict)
+                    if data__sections_item_is_dict:
+                        data__sections_item__missing_keys = set(['section_name', 'match_text', 'columns']) - data__sections_item.keys()
+                        if data__sections_item__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}]".format(**locals()) + " must contain " + (str(sorted(data__sections_item__missing_keys)) + " properties"), value=data__sections_item, name="" + (name_prefix or "data") + ".sections[{data__sections_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['section_name', 'match_text', 'columns'], 'properties': {'section_name': {'type': 'string', 'description': 'Logical name of the section (e.g., Purchases, Payments)'}, 'match_text': {'type': 'string', 'description': 'Anchor text in PDF to identify section'}, 'columns': {'type': 'object', 'description': 'Mapping of field names to column indices', 'patternProperties': {'^[a-zA-Z0-9_]+$': {'type': 'integer', 'minimum': 0}}, 'minProperties': 1}, 'skip_footer_rows': {'type': 'boolean', 'default': False}}}, rule='required')
+                        data__sections_item_keys = set(data__sections_item.keys())
+                        if "section_name" in data__sections_item_keys:
+                            data__sections_item_keys.remove("section_name")
+                            data__sections_item__sectionname = data__sections_item["section_name"]
+                            if not isinstance(data__sections_item__sectionname, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].section_name".format(**locals()) + " must be string", value=data__sections_item__sectionname, name="" + (name_prefix or "data") + ".sections[{data__sections_x}].section_name".format(**locals()) + "", definition={'type': 'string', 'description': 'Logical name of the section (e.g., Purchases, Payments)'}, rule='type')
+                        if "match_text" in data__sections_item_keys:
+                            data__sections_item_keys.remove("match_text")
+                            data__sections_item__matchtext = data__sections_item["match_text"]
+                            if not isinstance(data__sections_item__matchtext, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].match_text".format(**locals()) + " must be string", value=data__sections_item__matchtext, name="" + (name_prefix or "data") + ".sections[{data__sections_x}].match_text".format(**locals()) + "", definition={'type': 'string', 'description': 'Anchor text in PDF to identify section'}, rule='type')
+                        if "columns" in data__sections_item_keys:
+                            data__sections_item_keys.remove("columns")
+                            data__sections_item__columns = data__sections_item["columns"]
+                            if not isinstance(data__sections_item__columns, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].columns".format(**locals()) + " must be object", value=data__sections_item__columns, name="" + (name_prefix or "data") + ".sections[{data__sections_x}].columns".format(**locals()) + "", definition={'type': 'object', 'description': 'Mapping of field names to column indices', 'patternProperties': {'^[a-zA-Z0-9_]+$': {'type': 'integer', 'minimum': 0}}, 'minProperties': 1}, rule='type')
+                            data__sections_item__columns_is_dict = isinstance(data__sections_item__columns, dict)
+                            if data__sections_item__columns_is_dict:
+                                data__sections_item__columns_len = len(data__sections_item__columns)
+                                if data__sections_item__columns_len < 1:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].columns".format(**locals()) + " must contain at least 1 properties", value=data__sections_item__columns, name="" + (name_prefix or "data") + ".sections[{data__sections_x}].columns".format(**locals()) + "", definition={'type': 'object', 'description': 'Mapping of field names to column indices', 'patternProperties': {'^[a-zA-Z0-9_]+$': {'type': 'integer', 'minimum': 0}}, 'minProperties': 1}, rule='minProperties')
+                                data__sections_item__columns_keys = set(data__sections_item__columns.keys())
+                                for data__sections_item__columns_key, data__sections_item__columns_val in data__sections_item__columns.items():
+                                    if REGEX_PATTERNS['^[a-zA-Z0-9_]+$'].search(data__sections_item__columns_key):
+                                        if data__sections_item__columns_key in data__sections_item__columns_keys:
+                                            data__sections_item__columns_keys.remove(data__sections_item__columns_key)
+                                        if not isinstance(data__sections_item__columns_val, (int)) and not (isinstance(data__sections_item__columns_val, float) and data__sections_item__columns_val.is_integer()) or isinstance(data__sections_item__columns_val, bool):
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].columns.{data__sections_item__columns_key}".format(**locals()) + " must be integer", value=data__sections_item__columns_val, name="" + (name_prefix or "data") + ".sections[{data__sections_x}].columns.{data__sections_item__columns_key}".format(**locals()) + "", definition={'type': 'integer', 'minimum': 0}, rule='type')
+                                        if isinstance(data__sections_item__columns_val, (int, float, Decimal)):
+                                            if data__sections_item__columns_val < 0:
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].columns.{data__sections_item__columns_key}".format(**locals()) + " must be bigger than or equal to 0", value=data__sections_item__columns_val, name="" + (name_prefix or "data") + ".sections[{data__sections_x}].columns.{data__sections_item__columns_key}".format(**locals()) + "", definition={'type': 'integer', 'minimum': 0}, rule='minimum')
+                        if "skip_footer_rows" in data__sections_item_keys:
+                            data__sections_item_keys.remove("skip_footer_rows")
+                            data__sections_item__skipfooterrows = data__sections_item["skip_footer_rows"]
+                            if not isinstance(data__sections_item__skipfooterrows, (bool)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".sections[{data__sections_x}].skip_footer_rows".format(**locals()) + " must be boolean", value=data__sections_item__skipfooterrows, name="" + (name_prefix or "data") + ".sections[{data__sections_x}].skip_footer_rows".format(**locals()) + "", definition={'type': 'boolean', 'default': False}, rule='type')
+        if "csv_format" in data_keys:
+            data_keys.remove("csv_format")
+            data__csvformat = data["csv_format"]
+            if not isinstance(data__csvformat, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".csv_format must be object", value=data__csvformat, name="" + (name_prefix or "data") + ".csv_format", definition={'type': 'object', 'description': 'Optional CSV ingestion rules', 'required': ['date_format', 'columns'], 'properties': {'date_format': {'type': 'string', 'enum': ['YYYY-MM-DD', 'MM/DD/YYYY'], 'description': 'Date format used in CSV export'}, 'columns': {'type': 'object', 'description': 'Mapping of CSV fields to column indices', 'patternProperties': {'^[a-zA-Z0-9_]+$': {'type': 'integer', 'minimum': 0}}, 'minProperties': 1}, 'skip_footer_rows': {'type': 'boolean', 'default': False}}}, rule='type')
+            data__csvformat_is_dict = isinstance(data__csvformat, dict)
+            if data__csvformat_is_dict:
+                data__csvformat__missing_keys = set(['date_format', 'columns']) - data__csvformat.keys()
+                if data__csvformat__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".csv_format must contain " + (str(sorted(data__csvformat__missing_keys)) + " properties"), value=data__csvformat, name="" + (name_prefix or "data") + ".csv_format", definition={'type': 'object', 'description': 'Optional CSV ingestion rules', 'required': ['date_format', 'columns'], 'properties': {'date_format': {'type': 'string', 'enum': ['YYYY-MM-DD', 'MM/DD/YYYY'], 'description': 'Date format used in CSV export'}, 'columns': {'type': 'object', 'description': 'Mapping of CSV fields to column indices', 'patternProperties': {'^[a-zA-Z0-9_]+$': {'type': 'integer', 'minimum': 0}}, 'minProperties': 1}, 'skip_footer_rows': {'type': 'boolean', 'default': False}}}, rule='required')
+                data__csvformat_keys = set(data__csvformat.keys())
+                if "date_format" in data__csvformat_keys:
+                    data__csvformat_keys.remove("date_format")
+                    data__csvformat__dateformat = data__csvformat["date_format"]
+                    if not isinstance(data__csvformat__dateformat, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".csv_format.date_format must be string", value=data__csvformat__dateformat, name="" + (name_prefix or "data") + ".csv_format.date_format", definition={'type': 'string', 'enum': ['YYYY-MM-DD', 'MM/DD/YYYY'], 'description': 'Date format used in CSV export'}, rule='type')
+                    if not (isinstance(data__csvformat__dateformat, str) and data__csvformat__dateformat == 'YYYY-MM-DD' or isinstance(data__csvformat__dateformat, str) and data__csvformat__dateformat == 'MM/DD/YYYY'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".csv_format.date_format must be one of ['YYYY-MM-DD', 'MM/DD/YYYY']", value=data__csvformat__dateformat, name="" + (name_prefix or "data") + ".csv_format.date_format", definition={'type': 'string', 'enum': ['YYYY-MM-DD', 'MM/DD/YYYY'], 'description': 'Date format used in CSV export'}, rule='enum')
+                if "columns" in data__csvformat_keys:
+                    data__csvformat_keys.remove("columns")
+                    data__csvformat__columns = data__csvformat["columns"]
+                    if not isinstance(data__csvformat__columns, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".csv_format.columns must be object", value=data__csvformat__columns, name="" + (name_prefix or "data") + ".csv_format.columns", definition={'type': 'object', 'description': 'Mapping of CSV fields to column indices', 'patternProperties': {'^[a-zA-Z0-9_]+$': {'type': 'integer', 'minimum': 0}}, 'minProperties': 1}, rule='type')
+                    data__csvformat__columns_is_dict = isinstance(data__csvformat__columns, dict)
+                    if data__csvformat__columns_is_dict:
+                        data__csvformat__columns_len = len(data__csvformat__columns)
+                        if data__csvformat__columns_len < 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".csv_format.columns must contain at least 1 properties", value=data__csvformat__columns, name="" + (name_prefix or "data") + ".csv_format.columns", definition={'type': 'object', 'description': 'Mapping of CSV fields to column indices', 'patternProperties': {'^[a-zA-Z0-9_]+$': {'type': 'integer', 'minimum': 0}}, 'minProperties': 1}, rule='minProperties')
+                        data__csvformat__columns_keys = set(data__csvformat__columns.keys())
+                        for data__csvformat__columns_key, data__csvformat__columns_val in data__csvformat__columns.items():
+                            if REGEX_PATTERNS['^[a-zA-Z0-9_]+$'].search(data__csvformat__columns_key):
+                                if data__csvformat__columns_key in data__csvformat__columns_keys:
+                                    data__csvformat__columns_keys.remove(data__csvformat__columns_key)
+                                if not isinstance(data__csvformat__columns_val, (int)) and not (isinstance(data__csvformat__columns_val, float) and data__csvformat__columns_val.is_integer()) or isinstance(data__csvformat__columns_val, bool):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".csv_format.columns.{data__csvformat__columns_key}".format(**locals()) + " must be integer", value=data__csvformat__columns_val, name="" + (name_prefix or "data") + ".csv_format.columns.{data__csvformat__columns_key}".format(**locals()) + "", definition={'type': 'integer', 'minimum': 0}, rule='type')
+                                if isinstance(data__csvformat__columns_val, (int, float, Decimal)):
+                                    if data__csvformat__columns_val < 0:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".csv_format.columns.{data__csvformat__columns_key}".format(**locals()) + " must be bigger than or equal to 0", value=data__csvformat__columns_val, name="" + (name_prefix or "data") + ".csv_format.columns.{data__csvformat__columns_key}".format(**locals()) + "", definition={'type': 'integer', 'minimum': 0}, rule='minimum')
+                if "skip_footer_rows" in data__csvformat_keys:
+                    data__csvformat_keys.remove("skip_footer_rows")
+                    data__csvformat__skipfooterrows = data__csvformat["skip_footer_rows"]
+                    if not isinstance(data__csvformat__skipfooterrows, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".csv_format.skip_footer_rows must be boolean", value=data__csvformat__skipfooterrows, name="" + (name_prefix or "data") + ".csv_format.skip_footer_rows", definition={'type': 'boolean', 'default': False}, rule='type')
+    return data
\ No newline at end of file
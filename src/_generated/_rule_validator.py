@@ -0,0 +1,296 @@
+# Generated by `python -m src._generated` from config/schemas/rule_schema.json. Do not edit.
+SCHEMA_SHA256 = "2e684f9b59aef87e7aa2a9233704f3768fa87ec5f94b61d032189280eb287103"
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', 'title': 'Legacy Allocation Rules Schema (v1)', 'description': 'Schema for legacy classification rules used by the existing engine, extended with optional metadata for the Rule Generator Wizard.', 'type': 'object', 'required': ['_name', '_version', '_description', '_scope', '_rules'], 'additionalProperties': False, 'properties': {'_name': {'type': 'string'}, '_version': {'type': 'string'}, '_description': {'type': 'string'}, '_scope': {'type': 'array', 'items': {'type': 'string'}}, '_rules': {'type': 'array', 'items': {'type': 'object', 'required': ['category_name', 'transaction_type', 'logic', 'rules'], 'additionalProperties': False, 'properties': {'rule_id': {'type': 'string', 'description': 'Optional unique identifier for Wizard use. Ignored by legacy engine.'}, 'priority': {'type': 'integer', 'minimum': 0, 'description': 'Optional explicit priority for Wizard use. Legacy engine still uses file order.'}, 'scope': {'type': 'string', 'description': "Optional Wizard-defined scope tag (e.g., 'td_visa', 'global')."}, 'category_name': {'type': 'string'}, 'transaction_type': {'type': 'string', 'enum': ['EXPENSE', 'INCOME_TO_OFFSET_EXPENSE', 'MANUAL_CR', 'MANUAL_DR', 'IGNORE_TRANSACTION']}, 'logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}]}}, 'dual_entry': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'DR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'CR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'APPLY_PERCENTAGE': {'type': 'number'}}}}}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['_name', '_version', '_description', '_scope', '_rules']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', 'title': 'Legacy Allocation Rules Schema (v1)', 'description': 'Schema for legacy classification rules used by the existing engine, extended with optional metadata for the Rule Generator Wizard.', 'type': 'object', 'required': ['_name', '_version', '_description', '_scope', '_rules'], 'additionalProperties': False, 'properties': {'_name': {'type': 'string'}, '_version': {'type': 'string'}, '_description': {'type': 'string'}, '_scope': {'type': 'array', 'items': {'type': 'string'}}, '_rules': {'type': 'array', 'items': {'type': 'object', 'required': ['category_name', 'transaction_type', 'logic', 'rules'], 'additionalProperties': False, 'properties': {'rule_id': {'type': 'string', 'description': 'Optional unique identifier for Wizard use. Ignored by legacy engine.'}, 'priority': {'type': 'integer', 'minimum': 0, 'description': 'Optional explicit priority for Wizard use. Legacy engine still uses file order.'}, 'scope': {'type': 'string', 'description': "Optional Wizard-defined scope tag (e.g., 'td_visa', 'global')."}, 'category_name': {'type': 'string'}, 'transaction_type': {'type': 'string', 'enum': ['EXPENSE', 'INCOME_TO_OFFSET_EXPENSE', 'MANUAL_CR', 'MANUAL_DR', 'IGNORE_TRANSACTION']}, 'logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}]}}, 'dual_entry': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'DR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'CR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'APPLY_PERCENTAGE': {'type': 'number'}}}}}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "_name" in data_keys:
+            data_keys.remove("_name")
+            data__name = data["_name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + "._name must be string", value=data__name, name="" + (name_prefix or "data") + "._name", definition={'type': 'string'}, rule='type')
+        if "_version" in data_keys:
+            data_keys.remove("_version")
+            data__version = data["_version"]
+            if not isinstance(data__version, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + "._version must be string", value=data__version, name="" + (name_prefix or "data") + "._version", definition={'type': 'string'}, rule='type')
+        if "_description" in data_keys:
+            data_keys.remove("_description")
+            data__description = data["_description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + "._description must be string", value=data__description, name="" + (name_prefix or "data") + "._description", definition={'type': 'string'}, rule='type')
+        if "_scope" in data_keys:
+            data_keys.remove("_scope")
+            data__scope = data["_scope"]
+            if not isinstance(data__scope, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + "._scope must be array", value=data__scope, name="" + (name_prefix or "data") + "._scope", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+            data__scope_is_list = isinstance(data__scope, (list, tuple))
+            if data__scope_is_list:
+                data__scope_len = len(data__scope)
+                for data__scope_x, data__scope_item in enumerate(data__scope):
+                    if not isinstance(data__scope_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._scope[{data__scope_x}]".format(**locals()) + " must be string", value=data__scope_item, name="" + (name_prefix or "data") + "._scope[{data__scope_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "_rules" in data_keys:
+            data_keys.remove("_rules")
+            data__rules = data["_rules"]
+            if not isinstance(data__rules, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules must be array", value=data__rules, name="" + (name_prefix or "data") + "._rules", definition={'type': 'array', 'items': {'type': 'object', 'required': ['category_name', 'transaction_type', 'logic', 'rules'], 'additionalProperties': False, 'properties': {'rule_id': {'type': 'string', 'description': 'Optional unique identifier for Wizard use. Ignored by legacy engine.'}, 'priority': {'type': 'integer', 'minimum': 0, 'description': 'Optional explicit priority for Wizard use. Legacy engine still uses file order.'}, 'scope': {'type': 'string', 'description': "Optional Wizard-defined scope tag (e.g., 'td_visa', 'global')."}, 'category_name': {'type': 'string'}, 'transaction_type': {'type': 'string', 'enum': ['EXPENSE', 'INCOME_TO_OFFSET_EXPENSE', 'MANUAL_CR', 'MANUAL_DR', 'IGNORE_TRANSACTION']}, 'logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}]}}, 'dual_entry': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'DR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'CR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'APPLY_PERCENTAGE': {'type': 'number'}}}}}}, rule='type')
+            data__rules_is_list = isinstance(data__rules, (list, tuple))
+            if data__rules_is_list:
+                data__rules_len = len(data__rules)
+                for data__rules_x, data__rules_item in enumerate(data__rules):
+                    if not isinstance(data__rules_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}]".format(**locals()) + " must be object", value=data__rules_item, name="" + (name_prefix or "data") + "._rules[{data__rules_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['category_name', 'transaction_type', 'logic', 'rules'], 'additionalProperties': False, 'properties': {'rule_id': {'type': 'string', 'description': 'Optional unique identifier for Wizard use. Ignored by legacy engine.'}, 'priority': {'type': 'integer', 'minimum': 0, 'description': 'Optional explicit priority for Wizard use. Legacy engine still uses file order.'}, 'scope': {'type': 'string', 'description': "Optional Wizard-defined scope tag (e.g., 'td_visa', 'global')."}, 'category_name': {'type': 'string'}, 'transaction_type': {'type': 'string', 'enum': ['EXPENSE', 'INCOME_TO_OFFSET_EXPENSE', 'MANUAL_CR', 'MANUAL_DR', 'IGNORE_TRANSACTION']}, 'logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}]}}, 'dual_entry': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'DR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'CR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'APPLY_PERCENTAGE': {'type': 'number'}}}}}, rule='type')
+                    data__rules_item_is_dict = isinstance(data__rules_item, dict)
+                    if data__rules_item_is_dict:
+                        data__rules_item__missing_keys = set(['category_name', 'transaction_type', 'logic', 'rules']) - data__rules_item.keys()
+                        if data__rules_item__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}]".format(**locals()) + " must contain " + (str(sorted(data__rules_item__missing_keys)) + " properties"), value=data__rules_item, name="" + (name_prefix or "data") + "._rules[{data__rules_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['category_name', 'transaction_type', 'logic', 'rules'], 'additionalProperties': False, 'properties': {'rule_id': {'type': 'string', 'description': 'Optional unique identifier for Wizard use. Ignored by legacy engine.'}, 'priority': {'type': 'integer', 'minimum': 0, 'description': 'Optional explicit priority for Wizard use. Legacy engine still uses file order.'}, 'scope': {'type': 'string', 'description': "Optional Wizard-defined scope tag (e.g., 'td_visa', 'global')."}, 'category_name': {'type': 'string'}, 'transaction_type': {'type': 'string', 'enum': ['EXPENSE', 'INCOME_TO_OFFSET_EXPENSE', 'MANUAL_CR', 'MANUAL_DR', 'IGNORE_TRANSACTION']}, 'logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}]}}, 'dual_entry': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'DR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'CR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'APPLY_PERCENTAGE': {'type': 'number'}}}}}, rule='required')
+                        data__rules_item_keys = set(data__rules_item.keys())
+                        if "rule_id" in data__rules_item_keys:
+                            data__rules_item_keys.remove("rule_id")
+                            data__rules_item__ruleid = data__rules_item["rule_id"]
+                            if not isinstance(data__rules_item__ruleid, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rule_id".format(**locals()) + " must be string", value=data__rules_item__ruleid, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rule_id".format(**locals()) + "", definition={'type': 'string', 'description': 'Optional unique identifier for Wizard use. Ignored by legacy engine.'}, rule='type')
+                        if "priority" in data__rules_item_keys:
+                            data__rules_item_keys.remove("priority")
+                            data__rules_item__priority = data__rules_item["priority"]
+                            if not isinstance(data__rules_item__priority, (int)) and not (isinstance(data__rules_item__priority, float) and data__rules_item__priority.is_integer()) or isinstance(data__rules_item__priority, bool):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].priority".format(**locals()) + " must be integer", value=data__rules_item__priority, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].priority".format(**locals()) + "", definition={'type': 'integer', 'minimum': 0, 'description': 'Optional explicit priority for Wizard use. Legacy engine still uses file order.'}, rule='type')
+                            if isinstance(data__rules_item__priority, (int, float, Decimal)):
+                                if data__rules_item__priority < 0:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].priority".format(**locals()) + " must be bigger than or equal to 0", value=data__rules_item__priority, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].priority".format(**locals()) + "", definition={'type': 'integer', 'minimum': 0, 'description': 'Optional explicit priority for Wizard use. Legacy engine still uses file order.'}, rule='minimum')
+                        if "scope" in data__rules_item_keys:
+                            data__rules_item_keys.remove("scope")
+                            data__rules_item__scope = data__rules_item["scope"]
+                            if not isinstance(data__rules_item__scope, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].scope".format(**locals()) + " must be string", value=data__rules_item__scope, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].scope".format(**locals()) + "", definition={'type': 'string', 'description': "Optional Wizard-defined scope tag (e.g., 'td_visa', 'global')."}, rule='type')
+                        if "category_name" in data__rules_item_keys:
+                            data__rules_item_keys.remove("category_name")
+                            data__rules_item__categoryname = data__rules_item["category_name"]
+                            if not isinstance(data__rules_item__categoryname, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].category_name".format(**locals()) + " must be string", value=data__rules_item__categoryname, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].category_name".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "transaction_type" in data__rules_item_keys:
+                            data__rules_item_keys.remove("transaction_type")
+                            data__rules_item__transactiontype = data__rules_item["transaction_type"]
+                            if not isinstance(data__rules_item__transactiontype, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].transaction_type".format(**locals()) + " must be string", value=data__rules_item__transactiontype, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].transaction_type".format(**locals()) + "", definition={'type': 'string', 'enum': ['EXPENSE', 'INCOME_TO_OFFSET_EXPENSE', 'MANUAL_CR', 'MANUAL_DR', 'IGNORE_TRANSACTION']}, rule='type')
+                            if not (isinstance(data__rules_item__transactiontype, str) and data__rules_item__transactiontype == 'EXPENSE' or isinstance(data__rules_item__transactiontype, str) and data__rules_item__transactiontype == 'INCOME_TO_OFFSET_EXPENSE' or isinstance(data__rules_item__transactiontype, str) and data__rules_item__transactiontype == 'MANUAL_CR' or isinstance(data__rules_item__transactiontype, str) and data__rules_item__transactiontype == 'MANUAL_DR' or isinstance(data__rules_item__transactiontype, str) and data__rules_item__transactiontype == 'IGNORE_TRANSACTION'):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].transaction_type".format(**locals()) + " must be one of ['EXPENSE', 'INCOME_TO_OFFSET_EXPENSE', 'MANUAL_CR', 'MANUAL_DR', 'IGNORE_TRANSACTION']", value=data__rules_item__transactiontype, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].transaction_type".format(**locals()) + "", definition={'type': 'string', 'enum': ['EXPENSE', 'INCOME_TO_OFFSET_EXPENSE', 'MANUAL_CR', 'MANUAL_DR', 'IGNORE_TRANSACTION']}, rule='enum')
+                        if "logic" in data__rules_item_keys:
+                            data__rules_item_keys.remove("logic")
+                            data__rules_item__logic = data__rules_item["logic"]
+                            if not isinstance(data__rules_item__logic, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].logic".format(**locals()) + " must be string", value=data__rules_item__logic, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].logic".format(**locals()) + "", definition={'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, rule='type')
+                            if not (isinstance(data__rules_item__logic, str) and data__rules_item__logic == 'MUST_MATCH_ANY' or isinstance(data__rules_item__logic, str) and data__rules_item__logic == 'MUST_MATCH_ALL'):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].logic".format(**locals()) + " must be one of ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']", value=data__rules_item__logic, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].logic".format(**locals()) + "", definition={'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, rule='enum')
+                        if "rules" in data__rules_item_keys:
+                            data__rules_item_keys.remove("rules")
+                            data__rules_item__rules = data__rules_item["rules"]
+                            if not isinstance(data__rules_item__rules, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules".format(**locals()) + " must be array", value=data__rules_item__rules, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}]}}, rule='type')
+                            data__rules_item__rules_is_list = isinstance(data__rules_item__rules, (list, tuple))
+                            if data__rules_item__rules_is_list:
+                                data__rules_item__rules_len = len(data__rules_item__rules)
+                                for data__rules_item__rules_x, data__rules_item__rules_item in enumerate(data__rules_item__rules):
+                                    if not isinstance(data__rules_item__rules_item, (dict)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}]".format(**locals()) + " must be object", value=data__rules_item__rules_item, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}]".format(**locals()) + "", definition={'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}]}, rule='type')
+                                    data__rules_item__rules_item_one_of_count1 = 0
+                                    if data__rules_item__rules_item_one_of_count1 < 2:
+                                        try:
+                                            data__rules_item__rules_item_is_dict = isinstance(data__rules_item__rules_item, dict)
+                                            if data__rules_item__rules_item_is_dict:
+                                                data__rules_item__rules_item__missing_keys = set(['field', 'operator', 'value']) - data__rules_item__rules_item.keys()
+                                                if data__rules_item__rules_item__missing_keys:
+                                                    raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}]".format(**locals()) + " must contain " + (str(sorted(data__rules_item__rules_item__missing_keys)) + " properties"), value=data__rules_item__rules_item, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}]".format(**locals()) + "", definition={'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, rule='required')
+                                                data__rules_item__rules_item_keys = set(data__rules_item__rules_item.keys())
+                                                if "field" in data__rules_item__rules_item_keys:
+                                                    data__rules_item__rules_item_keys.remove("field")
+                                                    data__rules_item__rules_item__field = data__rules_item__rules_item["field"]
+                                                    if not isinstance(data__rules_item__rules_item__field, (str)):
+                                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].field".format(**locals()) + " must be string", value=data__rules_item__rules_item__field, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].field".format(**locals()) + "", definition={'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, rule='type')
+                                                    if not (isinstance(data__rules_item__rules_item__field, str) and data__rules_item__rules_item__field == 'Description' or isinstance(data__rules_item__rules_item__field, str) and data__rules_item__rules_item__field == 'Debit' or isinstance(data__rules_item__rules_item__field, str) and data__rules_item__rules_item__field == 'Credit' or isinstance(data__rules_item__rules_item__field, str) and data__rules_item__rules_item__field == 'Date' or isinstance(data__rules_item__rules_item__field, str) and data__rules_item__rules_item__field == 'Balance'):
+                                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].field".format(**locals()) + " must be one of ['Description', 'Debit', 'Credit', 'Date', 'Balance']", value=data__rules_item__rules_item__field, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].field".format(**locals()) + "", definition={'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, rule='enum')
+                                                if "operator" in data__rules_item__rules_item_keys:
+                                                    data__rules_item__rules_item_keys.remove("operator")
+                                                    data__rules_item__rules_item__operator = data__rules_item__rules_item["operator"]
+                                                    if not isinstance(data__rules_item__rules_item__operator, (str)):
+                                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].operator".format(**locals()) + " must be string", value=data__rules_item__rules_item__operator, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].operator".format(**locals()) + "", definition={'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, rule='type')
+                                                    if not (isinstance(data__rules_item__rules_item__operator, str) and data__rules_item__rules_item__operator == 'CONTAINS' or isinstance(data__rules_item__rules_item__operator, str) and data__rules_item__rules_item__operator == 'STARTS_WITH' or isinstance(data__rules_item__rules_item__operator, str) and data__rules_item__rules_item__operator == 'EQUALS' or isinstance(data__rules_item__rules_item__operator, str) and data__rules_item__rules_item__operator == 'BETWEEN' or isinstance(data__rules_item__rules_item__operator, str) and data__rules_item__rules_item__operator == 'LESS_THAN_OR_EQUAL_TO'):
+                                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].operator".format(**locals()) + " must be one of ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']", value=data__rules_item__rules_item__operator, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].operator".format(**locals()) + "", definition={'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, rule='enum')
+                                                if "value" in data__rules_item__rules_item_keys:
+                                                    data__rules_item__rules_item_keys.remove("value")
+                                                    data__rules_item__rules_item__value = data__rules_item__rules_item["value"]
+                                                if data__rules_item__rules_item_keys:
+                                                    raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}]".format(**locals()) + " must not contain "+str(data__rules_item__rules_item_keys)+" properties", value=data__rules_item__rules_item, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}]".format(**locals()) + "", definition={'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, rule='additionalProperties')
+                                            data__rules_item__rules_item_one_of_count1 += 1
+                                        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                                    if data__rules_item__rules_item_one_of_count1 < 2:
+                                        try:
+                                            data__rules_item__rules_item_is_dict = isinstance(data__rules_item__rules_item, dict)
+                                            if data__rules_item__rules_item_is_dict:
+                                                data__rules_item__rules_item__missing_keys = set(['group_logic', 'rules']) - data__rules_item__rules_item.keys()
+                                                if data__rules_item__rules_item__missing_keys:
+                                                    raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}]".format(**locals()) + " must contain " + (str(sorted(data__rules_item__rules_item__missing_keys)) + " properties"), value=data__rules_item__rules_item, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}]".format(**locals()) + "", definition={'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}, rule='required')
+                                                data__rules_item__rules_item_keys = set(data__rules_item__rules_item.keys())
+                                                if "group_logic" in data__rules_item__rules_item_keys:
+                                                    data__rules_item__rules_item_keys.remove("group_logic")
+                                                    data__rules_item__rules_item__grouplogic = data__rules_item__rules_item["group_logic"]
+                                                    if not isinstance(data__rules_item__rules_item__grouplogic, (str)):
+                                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].group_logic".format(**locals()) + " must be string", value=data__rules_item__rules_item__grouplogic, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].group_logic".format(**locals()) + "", definition={'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, rule='type')
+                                                    if not (isinstance(data__rules_item__rules_item__grouplogic, str) and data__rules_item__rules_item__grouplogic == 'MUST_MATCH_ANY' or isinstance(data__rules_item__rules_item__grouplogic, str) and data__rules_item__rules_item__grouplogic == 'MUST_MATCH_ALL'):
+                                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].group_logic".format(**locals()) + " must be one of ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']", value=data__rules_item__rules_item__grouplogic, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].group_logic".format(**locals()) + "", definition={'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, rule='enum')
+                                                if "rules" in data__rules_item__rules_item_keys:
+                                                    data__rules_item__rules_item_keys.remove("rules")
+                                                    data__rules_item__rules_item__rules = data__rules_item__rules_item["rules"]
+                                                    if not isinstance(data__rules_item__rules_item__rules, (list, tuple)):
+                                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].rules".format(**locals()) + " must be array", value=data__rules_item__rules_item__rules, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].rules".format(**locals()) + "", definition={'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}, rule='type')
+                                                    data__rules_item__rules_item__rules_is_list = isinstance(data__rules_item__rules_item__rules, (list, tuple))
+                                                    if data__rules_item__rules_item__rules_is_list:
+                                                        data__rules_item__rules_item__rules_len = len(data__rules_item__rules_item__rules)
+                                                        for data__rules_item__rules_item__rules_x, data__rules_item__rules_item__rules_item in enumerate(data__rules_item__rules_item__rules):
+                                                            validate___properties__rules_items_properties_rules_items(data__rules_item__rules_item__rules_item, custom_formats, (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}].rules[{data__rules_item__rules_item__rules_x}]".format(**locals()))
+                                                if data__rules_item__rules_item_keys:
+                                                    raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}]".format(**locals()) + " must not contain "+str(data__rules_item__rules_item_keys)+" properties", value=data__rules_item__rules_item, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}]".format(**locals()) + "", definition={'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}, rule='additionalProperties')
+                                            data__rules_item__rules_item_one_of_count1 += 1
+                                        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+                                    if data__rules_item__rules_item_one_of_count1 != 1:
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}]".format(**locals()) + " must be valid exactly by one definition" + (" (" + str(data__rules_item__rules_item_one_of_count1) + " matches found)"), value=data__rules_item__rules_item, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].rules[{data__rules_item__rules_x}]".format(**locals()) + "", definition={'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}]}, rule='oneOf')
+                        if "dual_entry" in data__rules_item_keys:
+                            data__rules_item_keys.remove("dual_entry")
+                            data__rules_item__dualentry = data__rules_item["dual_entry"]
+                            if not isinstance(data__rules_item__dualentry, (dict, NoneType)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry".format(**locals()) + " must be object or null", value=data__rules_item__dualentry, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry".format(**locals()) + "", definition={'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'DR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'CR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'APPLY_PERCENTAGE': {'type': 'number'}}}, rule='type')
+                            data__rules_item__dualentry_is_dict = isinstance(data__rules_item__dualentry, dict)
+                            if data__rules_item__dualentry_is_dict:
+                                data__rules_item__dualentry_keys = set(data__rules_item__dualentry.keys())
+                                if "DR_COLUMN" in data__rules_item__dualentry_keys:
+                                    data__rules_item__dualentry_keys.remove("DR_COLUMN")
+                                    data__rules_item__dualentry__DRCOLUMN = data__rules_item__dualentry["DR_COLUMN"]
+                                    if not isinstance(data__rules_item__dualentry__DRCOLUMN, (dict, NoneType)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.DR_COLUMN".format(**locals()) + " must be object or null", value=data__rules_item__dualentry__DRCOLUMN, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.DR_COLUMN".format(**locals()) + "", definition={'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, rule='type')
+                                    data__rules_item__dualentry__DRCOLUMN_is_dict = isinstance(data__rules_item__dualentry__DRCOLUMN, dict)
+                                    if data__rules_item__dualentry__DRCOLUMN_is_dict:
+                                        data__rules_item__dualentry__DRCOLUMN_keys = set(data__rules_item__dualentry__DRCOLUMN.keys())
+                                        if "name" in data__rules_item__dualentry__DRCOLUMN_keys:
+                                            data__rules_item__dualentry__DRCOLUMN_keys.remove("name")
+                                            data__rules_item__dualentry__DRCOLUMN__name = data__rules_item__dualentry__DRCOLUMN["name"]
+                                            if not isinstance(data__rules_item__dualentry__DRCOLUMN__name, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.DR_COLUMN.name".format(**locals()) + " must be string", value=data__rules_item__dualentry__DRCOLUMN__name, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.DR_COLUMN.name".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                        if "letter" in data__rules_item__dualentry__DRCOLUMN_keys:
+                                            data__rules_item__dualentry__DRCOLUMN_keys.remove("letter")
+                                            data__rules_item__dualentry__DRCOLUMN__letter = data__rules_item__dualentry__DRCOLUMN["letter"]
+                                            if not isinstance(data__rules_item__dualentry__DRCOLUMN__letter, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.DR_COLUMN.letter".format(**locals()) + " must be string", value=data__rules_item__dualentry__DRCOLUMN__letter, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.DR_COLUMN.letter".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                        if data__rules_item__dualentry__DRCOLUMN_keys:
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.DR_COLUMN".format(**locals()) + " must not contain "+str(data__rules_item__dualentry__DRCOLUMN_keys)+" properties", value=data__rules_item__dualentry__DRCOLUMN, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.DR_COLUMN".format(**locals()) + "", definition={'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, rule='additionalProperties')
+                                if "CR_COLUMN" in data__rules_item__dualentry_keys:
+                                    data__rules_item__dualentry_keys.remove("CR_COLUMN")
+                                    data__rules_item__dualentry__CRCOLUMN = data__rules_item__dualentry["CR_COLUMN"]
+                                    if not isinstance(data__rules_item__dualentry__CRCOLUMN, (dict, NoneType)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.CR_COLUMN".format(**locals()) + " must be object or null", value=data__rules_item__dualentry__CRCOLUMN, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.CR_COLUMN".format(**locals()) + "", definition={'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, rule='type')
+                                    data__rules_item__dualentry__CRCOLUMN_is_dict = isinstance(data__rules_item__dualentry__CRCOLUMN, dict)
+                                    if data__rules_item__dualentry__CRCOLUMN_is_dict:
+                                        data__rules_item__dualentry__CRCOLUMN_keys = set(data__rules_item__dualentry__CRCOLUMN.keys())
+                                        if "name" in data__rules_item__dualentry__CRCOLUMN_keys:
+                                            data__rules_item__dualentry__CRCOLUMN_keys.remove("name")
+                                            data__rules_item__dualentry__CRCOLUMN__name = data__rules_item__dualentry__CRCOLUMN["name"]
+                                            if not isinstance(data__rules_item__dualentry__CRCOLUMN__name, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.CR_COLUMN.name".format(**locals()) + " must be string", value=data__rules_item__dualentry__CRCOLUMN__name, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.CR_COLUMN.name".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                        if "letter" in data__rules_item__dualentry__CRCOLUMN_keys:
+                                            data__rules_item__dualentry__CRCOLUMN_keys.remove("letter")
+                                            data__rules_item__dualentry__CRCOLUMN__letter = data__rules_item__dualentry__CRCOLUMN["letter"]
+                                            if not isinstance(data__rules_item__dualentry__CRCOLUMN__letter, (str)):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.CR_COLUMN.letter".format(**locals()) + " must be string", value=data__rules_item__dualentry__CRCOLUMN__letter, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.CR_COLUMN.letter".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                                        if data__rules_item__dualentry__CRCOLUMN_keys:
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.CR_COLUMN".format(**locals()) + " must not contain "+str(data__rules_item__dualentry__CRCOLUMN_keys)+" properties", value=data__rules_item__dualentry__CRCOLUMN, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.CR_COLUMN".format(**locals()) + "", definition={'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, rule='additionalProperties')
+                                if "APPLY_PERCENTAGE" in data__rules_item__dualentry_keys:
+                                    data__rules_item__dualentry_keys.remove("APPLY_PERCENTAGE")
+                                    data__rules_item__dualentry__APPLYPERCENTAGE = data__rules_item__dualentry["APPLY_PERCENTAGE"]
+                                    if not isinstance(data__rules_item__dualentry__APPLYPERCENTAGE, (int, float, Decimal)) or isinstance(data__rules_item__dualentry__APPLYPERCENTAGE, bool):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.APPLY_PERCENTAGE".format(**locals()) + " must be number", value=data__rules_item__dualentry__APPLYPERCENTAGE, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry.APPLY_PERCENTAGE".format(**locals()) + "", definition={'type': 'number'}, rule='type')
+                                if data__rules_item__dualentry_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry".format(**locals()) + " must not contain "+str(data__rules_item__dualentry_keys)+" properties", value=data__rules_item__dualentry, name="" + (name_prefix or "data") + "._rules[{data__rules_x}].dual_entry".format(**locals()) + "", definition={'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'DR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'CR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'APPLY_PERCENTAGE': {'type': 'number'}}}, rule='additionalProperties')
+                        if data__rules_item_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + "._rules[{data__rules_x}]".format(**locals()) + " must not contain "+str(data__rules_item_keys)+" properties", value=data__rules_item, name="" + (name_prefix or "data") + "._rules[{data__rules_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['category_name', 'transaction_type', 'logic', 'rules'], 'additionalProperties': False, 'properties': {'rule_id': {'type': 'string', 'description': 'Optional unique identifier for Wizard use. Ignored by legacy engine.'}, 'priority': {'type': 'integer', 'minimum': 0, 'description': 'Optional explicit priority for Wizard use. Legacy engine still uses file order.'}, 'scope': {'type': 'string', 'description': "Optional Wizard-defined scope tag (e.g., 'td_visa', 'global')."}, 'category_name': {'type': 'string'}, 'transaction_type': {'type': 'string', 'enum': ['EXPENSE', 'INCOME_TO_OFFSET_EXPENSE', 'MANUAL_CR', 'MANUAL_DR', 'IGNORE_TRANSACTION']}, 'logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}]}}, 'dual_entry': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'DR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'CR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'APPLY_PERCENTAGE': {'type': 'number'}}}}}, rule='additionalProperties')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', 'title': 'Legacy Allocation Rules Schema (v1)', 'description': 'Schema for legacy classification rules used by the existing engine, extended with optional metadata for the Rule Generator Wizard.', 'type': 'object', 'required': ['_name', '_version', '_description', '_scope', '_rules'], 'additionalProperties': False, 'properties': {'_name': {'type': 'string'}, '_version': {'type': 'string'}, '_description': {'type': 'string'}, '_scope': {'type': 'array', 'items': {'type': 'string'}}, '_rules': {'type': 'array', 'items': {'type': 'object', 'required': ['category_name', 'transaction_type', 'logic', 'rules'], 'additionalProperties': False, 'properties': {'rule_id': {'type': 'string', 'description': 'Optional unique identifier for Wizard use. Ignored by legacy engine.'}, 'priority': {'type': 'integer', 'minimum': 0, 'description': 'Optional explicit priority for Wizard use. Legacy engine still uses file order.'}, 'scope': {'type': 'string', 'description': "Optional Wizard-defined scope tag (e.g., 'td_visa', 'global')."}, 'category_name': {'type': 'string'}, 'transaction_type': {'type': 'string', 'enum': ['EXPENSE', 'INCOME_TO_OFFSET_EXPENSE', 'MANUAL_CR', 'MANUAL_DR', 'IGNORE_TRANSACTION']}, 'logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}]}}, 'dual_entry': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'DR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'CR_COLUMN': {'type': ['object', 'null'], 'additionalProperties': False, 'properties': {'name': {'type': 'string'}, 'letter': {'type': 'string'}}}, 'APPLY_PERCENTAGE': {'type': 'number'}}}}}}}}, rule='additionalProperties')
+    return data
+
+def validate___properties__rules_items_properties_rules_items(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}]}, rule='type')
+    data_one_of_count2 = 0
+    if data_one_of_count2 < 2:
+        try:
+            data_is_dict = isinstance(data, dict)
+            if data_is_dict:
+                data__missing_keys = set(['field', 'operator', 'value']) - data.keys()
+                if data__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, rule='required')
+                data_keys = set(data.keys())
+                if "field" in data_keys:
+                    data_keys.remove("field")
+                    data__field = data["field"]
+                    if not isinstance(data__field, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".field must be string", value=data__field, name="" + (name_prefix or "data") + ".field", definition={'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, rule='type')
+                    if not (isinstance(data__field, str) and data__field == 'Description' or isinstance(data__field, str) and data__field == 'Debit' or isinstance(data__field, str) and data__field == 'Credit' or isinstance(data__field, str) and data__field == 'Date' or isinstance(data__field, str) and data__field == 'Balance'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".field must be one of ['Description', 'Debit', 'Credit', 'Date', 'Balance']", value=data__field, name="" + (name_prefix or "data") + ".field", definition={'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, rule='enum')
+                if "operator" in data_keys:
+                    data_keys.remove("operator")
+                    data__operator = data["operator"]
+                    if not isinstance(data__operator, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".operator must be string", value=data__operator, name="" + (name_prefix or "data") + ".operator", definition={'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, rule='type')
+                    if not (isinstance(data__operator, str) and data__operator == 'CONTAINS' or isinstance(data__operator, str) and data__operator == 'STARTS_WITH' or isinstance(data__operator, str) and data__operator == 'EQUALS' or isinstance(data__operator, str) and data__operator == 'BETWEEN' or isinstance(data__operator, str) and data__operator == 'LESS_THAN_OR_EQUAL_TO'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".operator must be one of ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']", value=data__operator, name="" + (name_prefix or "data") + ".operator", definition={'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, rule='enum')
+                if "value" in data_keys:
+                    data_keys.remove("value")
+                    data__value = data["value"]
+                if data_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, rule='additionalProperties')
+            data_one_of_count2 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+    if data_one_of_count2 < 2:
+        try:
+            data_is_dict = isinstance(data, dict)
+            if data_is_dict:
+                data__missing_keys = set(['group_logic', 'rules']) - data.keys()
+                if data__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}, rule='required')
+                data_keys = set(data.keys())
+                if "group_logic" in data_keys:
+                    data_keys.remove("group_logic")
+                    data__grouplogic = data["group_logic"]
+                    if not isinstance(data__grouplogic, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".group_logic must be string", value=data__grouplogic, name="" + (name_prefix or "data") + ".group_logic", definition={'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, rule='type')
+                    if not (isinstance(data__grouplogic, str) and data__grouplogic == 'MUST_MATCH_ANY' or isinstance(data__grouplogic, str) and data__grouplogic == 'MUST_MATCH_ALL'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".group_logic must be one of ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']", value=data__grouplogic, name="" + (name_prefix or "data") + ".group_logic", definition={'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, rule='enum')
+                if "rules" in data_keys:
+                    data_keys.remove("rules")
+                    data__rules = data["rules"]
+                    if not isinstance(data__rules, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".rules must be array", value=data__rules, name="" + (name_prefix or "data") + ".rules", definition={'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}, rule='type')
+                    data__rules_is_list = isinstance(data__rules, (list, tuple))
+                    if data__rules_is_list:
+                        data__rules_len = len(data__rules)
+                        for data__rules_x, data__rules_item in enumerate(data__rules):
+                            validate___properties__rules_items_properties_rules_items(data__rules_item, custom_formats, (name_prefix or "data") + ".rules[{data__rules_x}]".format(**locals()))
+                if data_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}, rule='additionalProperties')
+            data_one_of_count2 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+    if data_one_of_count2 != 1:
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be valid exactly by one definition" + (" (" + str(data_one_of_count2) + " matches found)"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'type': 'object', 'oneOf': [{'required': ['field', 'operator', 'value'], 'additionalProperties': False, 'properties': {'field': {'type': 'string', 'enum': ['Description', 'Debit', 'Credit', 'Date', 'Balance']}, 'operator': {'type': 'string', 'enum': ['CONTAINS', 'STARTS_WITH', 'EQUALS', 'BETWEEN', 'LESS_THAN_OR_EQUAL_TO']}, 'value': {}}}, {'required': ['group_logic', 'rules'], 'additionalProperties': False, 'properties': {'group_logic': {'type': 'string', 'enum': ['MUST_MATCH_ANY', 'MUST_MATCH_ALL']}, 'rules': {'type': 'array', 'items': {'$ref': '#/properties/_rules/items/properties/rules/items'}}}}]}}}}]}, rule='oneOf')
+    return data
\ No newline at end of file
@@ -1,4 +1,9 @@
 import re
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+from functools import partial
+from typing import Callable
 
 # Operator functions
 OPERATORS = {
@@ -13,6 +18,195 @@ OPERATORS = {
     "BETWEEN": lambda n, rng: float(rng[0]) <= float(n) <= float(rng[1]),
 }
 
+# Operators whose match implies the lowercased value occurs in the field text
+_LITERAL_OPERATORS = {"CONTAINS", "STARTS_WITH"}
+
+# Distinct field-value combinations whose first matching rule is remembered per classifier
+_MATCH_CACHE_SIZE = 4096
+
+# Field value types whose str() form fixes everything a predicate can observe
+# (str(), .lower(), float(), truthiness); other types are never memoized.
+_MEMO_SAFE_TYPES = frozenset({str, int, float, bool, type(None), Decimal, date, datetime})
+
+
+def _is_well_formed(rule: dict) -> bool:
+    """True when evaluating the rule can never raise (known operators, complete conditions)."""
+    if not isinstance(rule, dict) or not isinstance(rule.get("rules", []), list):
+        return False
+    for cond in rule.get("rules", []):
+        if not isinstance(cond, dict):
+            return False
+        leaves = cond.get("rules") if "group_logic" in cond else [cond]
+        if not isinstance(leaves, list):
+            return False
+        for leaf in leaves:
+            if not isinstance(leaf, dict) or not {"field", "operator", "value"} <= leaf.keys():
+                return False
+            if leaf["operator"] not in OPERATORS:
+                return False
+    return True
+
+
+def _required_literals(conditions: list, match_all: bool):
+    """
+    Return lowercase Description literals of which at least one must occur for the conditions to match.
+
+    None means there is no such guarantee and the conditions always have to be evaluated.
+    """
+    child_literals = []
+    for cond in conditions:
+        if "group_logic" in cond:
+            child_literals.append(_required_literals(cond["rules"], cond["group_logic"] == "MUST_MATCH_ALL"))
+        elif cond["field"] == "Description" and cond["operator"] in _LITERAL_OPERATORS and isinstance(cond["value"], str):
+            child_literals.append({cond["value"].lower()})
+        else:
+            child_literals.append(None)
+
+    if match_all:
+        # Any single child's requirement is enough; the narrowest one filters best.
+        known = [literals for literals in child_literals if literals is not None]
+        return min(known, key=len) if known else None
+    if any(literals is None for literals in child_literals):
+        return None
+    return set().union(*child_literals)
+
+
+def _referenced_fields(rules: list):
+    """Sorted tuple of every transaction field the (well-formed) rules read, or None if any rule is malformed."""
+    fields = set()
+    for rule in rules:
+        if not _is_well_formed(rule):
+            return None
+        for cond in rule.get("rules", []):
+            for leaf in cond["rules"] if "group_logic" in cond else [cond]:
+                fields.add(leaf["field"])
+    return tuple(sorted(fields, key=str))
+
+
+def _lowered_description(transaction: dict) -> str:
+    try:
+        return (transaction.get("Description") or "").lower()
+    except AttributeError:
+        return ""
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+def _never(transaction: dict) -> bool:
+    return False
+
+
+def _compile_condition(cond: dict) -> Callable[[dict], bool]:
+    """
+    Compile one well-formed condition, mirroring OPERATORS exactly.
+
+    Any error the operator would raise for every transaction (bad constant)
+    compiles to _never; per-transaction errors still evaluate to False.
+    """
+    field = cond["field"]
+    operator = cond["operator"]
+    value = cond["value"]
+
+    try:
+        if operator in ("CONTAINS", "STARTS_WITH"):
+            needle = value.lower()
+        elif operator == "EQUALS":
+            needle = str(value).lower()
+        elif operator == "REGEX":
+            pattern = re.compile(value)
+        elif operator == "BETWEEN":
+            low, high = float(value[0]), float(value[1])
+        else:
+            threshold = float(value)
+    except Exception:
+        return _never
+
+    if operator == "CONTAINS":
+        def predicate(transaction):
+            try:
+                return needle in (transaction.get(field) or "").lower()
+            except Exception:
+                return False
+    elif operator == "STARTS_WITH":
+        def predicate(transaction):
+            try:
+                return (transaction.get(field) or "").lower().startswith(needle)
+            except Exception:
+                return False
+    elif operator == "EQUALS":
+        def predicate(transaction):
+            try:
+                return str(transaction.get(field)).lower() == needle
+            except Exception:
+                return False
+    elif operator == "REGEX":
+        def predicate(transaction):
+            try:
+                return pattern.search(transaction.get(field) or "") is not None
+            except Exception:
+                return False
+    elif operator == "BETWEEN":
+        return _compile_between(field, low, high)
+    else:
+        return _compile_threshold(field, operator, threshold)
+    return predicate
+
+
+def _compile_between(field: str, low: float, high: float) -> Callable[[dict], bool]:
+    def predicate(transaction):
+        try:
+            return low <= float(transaction.get(field)) <= high
+        except Exception:
+            return False
+    return predicate
+
+
+def _compile_threshold(field: str, operator: str, threshold: float) -> Callable[[dict], bool]:
+    """One closure per comparison so the hot amount checks run inline, with no comparator call."""
+    if operator == "LESS_THAN_OR_EQUAL_TO":
+        def predicate(transaction):
+            try:
+                return float(transaction.get(field)) <= threshold
+            except Exception:
+                return False
+    elif operator == "LESS_THAN":
+        def predicate(transaction):
+            try:
+                return float(transaction.get(field)) < threshold
+            except Exception:
+                return False
+    elif operator == "GREATER_THAN_OR_EQUAL_TO":
+        def predicate(transaction):
+            try:
+                return float(transaction.get(field)) >= threshold
+            except Exception:
+                return False
+    else:
+        def predicate(transaction):
+            try:
+                return float(transaction.get(field)) > threshold
+            except Exception:
+                return False
+    return predicate
+
+
+def _compile_conditions(conditions: list, match_all: bool) -> Callable[[dict], bool]:
+    """Compile a (well-formed) condition list; ALL/ANY short-circuit since no condition can raise."""
+    predicates = [
+        _compile_conditions(cond["rules"], cond["group_logic"] == "MUST_MATCH_ALL")
+        if "group_logic" in cond
+        else _compile_condition(cond)
+        for cond in conditions
+    ]
+    if len(predicates) == 1:
+        return predicates[0]
+    if match_all:
+        return lambda transaction: all(predicate(transaction) for predicate in predicates)
+    return lambda transaction: any(predicate(transaction) for predicate in predicates)
+
+
 class TransactionClassifier:
     """
     Applies allocation_rules.json to classify transactions.
@@ -21,19 +215,143 @@ class TransactionClassifier:
 
     def __init__(self, rules: list):
         self.rules = rules
+        self._literal_index, self._always_checked = self._build_literal_index(rules)
+        self._compiled = [self._compile_rule(rule) for rule in rules]
+        self._result_templates = {}
+        self._key_fields = _referenced_fields(rules)
+        self._first_match = {}
 
     def classify(self, transaction: dict) -> dict:
         """
         Classify a single transaction.
         Returns a dict with category, transaction_type, and dual_entry mapping.
         """
-        for rule in self.rules:
-            if self._evaluate_rule(rule, transaction):
-                return {
-                    "category": rule["category_name"],
-                    "transaction_type": rule["transaction_type"],
-                    "dual_entry": rule.get("dual_entry"),
-                }
+        idx = self._first_match_index(transaction)
+        if idx is None:
+            return self._unclassified(transaction)
+        return self._matched(idx)
+
+    def _first_match_index(self, transaction: dict):
+        """
+        Index of the first rule matching the transaction, or None.
+
+        Results are remembered per exact combination of the field values the rules
+        read (value and type), so repeated merchants skip rule evaluation entirely.
+        """
+        key = self._match_key(transaction)
+        if key is not None and key in self._first_match:
+            return self._first_match[key]
+
+        match = None
+        for idx in self._candidate_indexes(transaction):
+            if self._compiled[idx](transaction):
+                match = idx
+                break
+
+        if key is not None:
+            self._remember(key, match)
+        return match
+
+    def _match_key(self, transaction: dict):
+        """
+        Hashable key of exactly what the predicates see in the fields the rules read,
+        or None when results can't be shared.
+
+        Values are keyed by type and str() form, not by equality: 0.0 == -0.0 and
+        Decimal("1.0") == Decimal("1.00"), yet EQUALS tells them apart.
+        """
+        if self._key_fields is None:
+            return None
+        values = tuple(map(transaction.get, self._key_fields))
+        types = tuple(map(type, values))
+        if not _MEMO_SAFE_TYPES.issuperset(types):
+            return None
+        return types, tuple(value if kind is str else str(value) for value, kind in zip(values, types))
+
+    def _remember(self, key, match):
+        if len(self._first_match) >= _MATCH_CACHE_SIZE:
+            del self._first_match[next(iter(self._first_match))]
+        self._first_match[key] = match
+
+    def classify_batch(self, transactions: list) -> list:
+        """
+        Classify many transactions at once; same results as calling classify() on each.
+
+        Identical transactions (same values in every field the rules read) are
+        evaluated once. The rest are worked rule by rule: each rule only sees the
+        still-unclassified rows whose descriptions contain one of its literals,
+        so first-match-wins is kept.
+        """
+        transactions = list(transactions)
+
+        # One representative row per distinct transaction; known ones come from the classify() memo.
+        match_of_row = [None] * len(transactions)
+        shared_with = list(range(len(transactions)))
+        pending = []
+        pending_keys = {}
+        for row, transaction in enumerate(transactions):
+            key = self._match_key(transaction)
+            if key is None:
+                pending.append(row)
+            elif key in self._first_match:
+                match_of_row[row] = self._first_match[key]
+            elif key in pending_keys:
+                shared_with[row] = pending_keys[key]
+            else:
+                pending_keys[key] = row
+                pending.append(row)
+
+        # Rows per rule from one substring pass over the pending rows per distinct literal.
+        rows_by_rule = {}
+        if self._literal_index:
+            descriptions = [(row, _lowered_description(transactions[row])) for row in pending]
+            for literal, rule_ids in self._literal_index.items():
+                rows = {row for row, description in descriptions if literal in description}
+                if rows:
+                    for rule_id in rule_ids:
+                        rows_by_rule.setdefault(rule_id, set()).update(rows)
+        always_checked = set(self._always_checked) if self._literal_index else None
+
+        unassigned = pending
+        for idx, predicate in enumerate(self._compiled):
+            if not unassigned:
+                break
+            if always_checked is None or idx in always_checked:
+                rows = unassigned
+            elif idx in rows_by_rule:
+                allowed = rows_by_rule[idx]
+                rows = [row for row in unassigned if row in allowed]
+            else:
+                continue
+            matched = {row for row in rows if predicate(transactions[row])}
+            if matched:
+                for row in matched:
+                    match_of_row[row] = idx
+                unassigned = [row for row in unassigned if row not in matched]
+
+        for key, row in pending_keys.items():
+            self._remember(key, match_of_row[row])
+
+        results = []
+        for row, transaction in enumerate(transactions):
+            idx = match_of_row[shared_with[row]]
+            results.append(self._unclassified(transaction) if idx is None else self._matched(idx))
+        return results
+
+    def _matched(self, idx: int) -> dict:
+        """Result for rule idx: built (with interned enum-like strings) on first match, then copied."""
+        template = self._result_templates.get(idx)
+        if template is None:
+            rule = self.rules[idx]
+            template = self._result_templates[idx] = {
+                "category": _intern(rule["category_name"]),
+                "transaction_type": _intern(rule["transaction_type"]),
+                "dual_entry": rule.get("dual_entry"),
+            }
+        return template.copy()
+
+    @staticmethod
+    def _unclassified(transaction: dict) -> dict:
         # Default: manual review
         return {
             "category": "Unclassified",
@@ -41,6 +359,49 @@ class TransactionClassifier:
             "dual_entry": None,
         }
 
+    def _candidate_indexes(self, transaction: dict):
+        """Indexes of the rules that could match this transaction, in priority order."""
+        if not self._literal_index:
+            return range(len(self.rules))
+        description = _lowered_description(transaction)
+        candidates = set(self._always_checked)
+        for literal, rule_ids in self._literal_index.items():
+            if literal in description:
+                candidates.update(rule_ids)
+        return sorted(candidates)
+
+    @staticmethod
+    def _build_literal_index(rules: list) -> tuple:
+        """
+        Map lowercase Description literals to the rules that need one of them to match.
+
+        Rules without such a literal (numeric-only rules, malformed rules that must
+        still raise) are returned separately and checked for every transaction.
+        """
+        literal_index = {}
+        always_checked = []
+        for idx, rule in enumerate(rules):
+            literals = None
+            if _is_well_formed(rule):
+                match_all = rule.get("logic", "MUST_MATCH_ANY") == "MUST_MATCH_ALL"
+                literals = _required_literals(rule.get("rules", []), match_all)
+            if literals is None:
+                always_checked.append(idx)
+                continue
+            for literal in literals:
+                literal_index.setdefault(literal, []).append(idx)
+        return literal_index, always_checked
+
+    def _compile_rule(self, rule: dict) -> Callable[[dict], bool]:
+        """
+        Turn a rule into a transaction predicate with its constants normalized up front.
+
+        Malformed rules keep the interpreted path so they raise exactly as before.
+        """
+        if not _is_well_formed(rule):
+            return partial(self._evaluate_rule, rule)
+        return _compile_conditions(rule.get("rules", []), rule.get("logic", "MUST_MATCH_ANY") == "MUST_MATCH_ALL")
+
     def _evaluate_rule(self, rule: dict, transaction: dict) -> bool:
         """Evaluate a rule against a transaction."""
         logic = rule.get("logic", "MUST_MATCH_ANY")
@@ -171,79 +171,54 @@ class SpreadsheetExporter:
         start = totals_row + separation + 1  # separation empty rows, then summary row
         top_row = start
         bottom_row = start + 1
+        ws = self.ws
 
         # Merge left column and style
-        left_range = f"G{top_row}:G{bottom_row}"
-        self.ws.merge_cells(left_range)
-        left_cell = self.ws[f"G{top_row}"]
-        left_cell.value = "ANNUAL\nSUMMARY"
+        ws.merge_cells(f"G{top_row}:G{bottom_row}")
+        left_cell = ws.cell(row=top_row, column=7, value="ANNUAL\nSUMMARY")
         left_cell.font = Font(bold=True, color="FFFFFF")
         left_cell.fill = PatternFill("solid", fgColor="203764")  # navy-like
         left_cell.alignment = Alignment(horizontal="right", vertical="center", wrap_text=True)
 
-        # Headers (top row)
-        headers = [("H", "INCOME"), ("I", "EXPENSES"), ("J", "NET")]
+        # Headers (top row) H/I/J share one set of style objects
+        header_font = Font(bold=True)
         header_fill = PatternFill("solid", fgColor="D9D9D9")
-        for col, label in headers:
-            c = self.ws[f"{col}{top_row}"]
-            c.value = label
-            c.font = Font(bold=True)
+        header_alignment = Alignment(horizontal="center", vertical="center")
+        for column, label in ((8, "INCOME"), (9, "EXPENSES"), (10, "NET")):
+            c = ws.cell(row=top_row, column=column, value=label)
+            c.font = header_font
             c.fill = header_fill
-            c.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Formulas (bottom row)
-        income_cell = f"H{bottom_row}"
-        expenses_cell = f"I{bottom_row}"
-        net_cell = f"J{bottom_row}"
-
-        self.ws[income_cell].value = f"=H{totals_row}"
-        self.ws[expenses_cell].value = f"=SUM(I{totals_row}:W{totals_row})"
-        self.ws[net_cell].value = f"={income_cell}-{expenses_cell}"
-
-        # Numeric format and alignment
-        for coord in (income_cell, expenses_cell, net_cell):
-            cell = self.ws[coord]
+            c.alignment = header_alignment
+
+        # Formulas (bottom row), numeric format and alignment
+        value_alignment = Alignment(horizontal="right", vertical="center")
+        formulas = (
+            (8, f"=H{totals_row}"),
+            (9, f"=SUM(I{totals_row}:W{totals_row})"),
+            (10, f"=H{bottom_row}-I{bottom_row}"),
+        )
+        for column, formula in formulas:
+            cell = ws.cell(row=bottom_row, column=column, value=formula)
             cell.number_format = "#,##0.00"
-            cell.alignment = Alignment(horizontal="right", vertical="center")
-
-        # Borders: thick outer border around G{top_row}:J{bottom_row}
-        for r in range(top_row, bottom_row + 1):
-            top_side = self.thick_side if r == top_row else self.thin_side
-            bottom_side = self.thick_side if r == bottom_row else self.thin_side
+            cell.alignment = value_alignment
 
-            # Left column cell
-            left = self.ws[f"G{r}"]
-            left.border = Border(top=top_side, bottom=bottom_side, left=self.thick_side, right=self.thin_side)
-
-            # Middle columns H/I
-            for col in ("H", "I"):
-                cell = self.ws[f"{col}{r}"]
-                cell.border = Border(top=top_side, bottom=bottom_side, left=self.thin_side, right=self.thin_side)
-
-            # Rightmost column J: outer right thick
-            right = self.ws[f"J{r}"]
-            right.border = Border(top=top_side, bottom=bottom_side, left=self.thin_side, right=self.thick_side)
-
-        # Double bottom border on NET value
+        # Borders: thick outer border around G{top_row}:J{bottom_row}; NET value gets a double bottom
+        thin, thick = self.thin_side, self.thick_side
         double_bottom = Side(border_style="double", color="000000")
-        net_cell_obj = self.ws[net_cell]
-        # keep existing top/left/right sides if present, overwrite bottom
-        existing = net_cell_obj.border
-        net_cell_obj.border = Border(
-            top=existing.top or self.thin_side,
-            left=existing.left or self.thin_side,
-            right=existing.right or self.thin_side,
-            bottom=double_bottom,
-        )
+        for r, top_side, bottom_side in ((top_row, thick, thin), (bottom_row, thin, thick)):
+            ws.cell(row=r, column=7).border = Border(top=top_side, bottom=bottom_side, left=thick, right=thin)
+            middle = Border(top=top_side, bottom=bottom_side, left=thin, right=thin)
+            ws.cell(row=r, column=8).border = middle
+            ws.cell(row=r, column=9).border = middle
+            right_bottom = double_bottom if r == bottom_row else bottom_side
+            ws.cell(row=r, column=10).border = Border(top=top_side, bottom=right_bottom, left=thin, right=thick)
 
         # Conditional formatting for NET cell (>0 green, <0 red)
-        green_font = Font(color="008000")
-        red_font = Font(color="FF0000")
-
-        self.ws.conditional_formatting.add(net_cell,
-            CellIsRule(operator="greaterThan", formula=["0"], font=green_font))
-        self.ws.conditional_formatting.add(net_cell,
-            CellIsRule(operator="lessThan", formula=["0"], font=red_font))
+        net_cell = f"J{bottom_row}"
+        ws.conditional_formatting.add(net_cell,
+            CellIsRule(operator="greaterThan", formula=["0"], font=Font(color="008000")))
+        ws.conditional_formatting.add(net_cell,
+            CellIsRule(operator="lessThan", formula=["0"], font=Font(color="FF0000")))
 
 
     def add_color_legend(self, last_transaction_row: int, separation: int = 5):
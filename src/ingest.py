@@ -13,6 +13,7 @@ Normalizes into internal structure:
 import csv
 from typing import List, Dict, Union
 from datetime import datetime
+from functools import lru_cache
 
 DEFAULT_HEADERS = ["Date", "Description", "Debit", "Credit", "Balance"]
 
@@ -34,21 +35,49 @@ def load_csv(path: str) -> List[Dict]:
         first_cell = first_line.split(",")[0]
         has_headers = not looks_like_date(first_cell)
 
-        if has_headers:
-            reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, []) if has_headers else DEFAULT_HEADERS
+        # Resolve columns once instead of building a dict per row (csv.DictReader).
+        # Later duplicates win, as they would in the DictReader row dict.
+        positions = {name: idx for idx, name in enumerate(header)}
+        date_idx = positions.get("Date")
+        desc_idx = positions.get("Description")
+        if "Debit" in positions or "Credit" in positions:
+            amount_idxs = (positions.get("Debit"), positions.get("Credit"), None)
         else:
-            reader = csv.DictReader(f, fieldnames=DEFAULT_HEADERS)
+            amount_idxs = (None, None, positions.get("Amount"))
+        debit_idx, credit_idx, amount_idx = amount_idxs
 
         for row in reader:
-            tx = normalize_row(row)
-            if tx:  # skip empty or malformed rows
-                # Ensure Balance exists
-                if "Balance" not in tx:
-                    tx["Balance"] = None
-                # Tag source
-                tx["source"] = "bank_account"
-                transactions.append(tx)
-                
+            if not row:  # DictReader skips blank lines too
+                continue
+            width = len(row)
+            # Blank amount cells are common (one of Debit/Credit per row) and parse to 0.0,
+            # so they skip the parse_amount call entirely.
+            debit = credit = 0.0
+            if amount_idx is not None:
+                cell = row[amount_idx] if amount_idx < width else None
+                if cell:
+                    amt = parse_amount(cell)
+                    # Sign split: negatives are debits (as a magnitude), the rest credits.
+                    if amt < 0:
+                        debit = -amt
+                    else:
+                        credit = amt
+            else:
+                if debit_idx is not None and debit_idx < width and row[debit_idx]:
+                    debit = parse_amount(row[debit_idx])
+                if credit_idx is not None and credit_idx < width and row[credit_idx]:
+                    credit = parse_amount(row[credit_idx])
+            transactions.append({
+                "Date": _parse_date_cached(row[date_idx] if date_idx is not None and date_idx < width else None),
+                "Description": clean_description(row[desc_idx] if desc_idx is not None and desc_idx < width else None),
+                "Debit": debit,
+                "Credit": credit,
+                "Balance": None,
+                "source": "bank_account",
+            })
+
     return transactions
 
 def normalize_row(row: Dict[str, str]) -> Dict[str, Union[str, float, None]]:
@@ -95,6 +124,9 @@ def parse_date(value: Union[str, None]):
             continue
     return value.strip()  # fallback: return raw
 
+# Statements repeat the same few dates across many rows.
+_parse_date_cached = lru_cache(maxsize=1024)(parse_date)
+
 def clean_description(value: Union[str, None]) -> str:
     """Normalize description text."""
     if not value:
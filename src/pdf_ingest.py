@@ -5,6 +5,8 @@ This module discovers, normalizes, parses, and exports transactions
 from credit card statement PDFs (e.g., Triangle MasterCard, TD Visa).
 """
 import csv
+import logging
+import os
 import re
 import pathlib
 import pdfplumber
@@ -13,8 +15,11 @@ import tempfile
 import webbrowser, pathlib
 from typing import List, Dict, Optional, Literal
 from datetime import datetime
+import src.utils
 from src.utils import load_bank_profile, notify, debug_mode, time_it, normalize_tx_to_canonical_shape
 from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 
 
 def discover_pdfs(year_dir: str):
@@ -172,6 +177,7 @@ def debug_visualize_column_zones(page, crop_bbox: tuple, break_points: List[floa
     return saved_path
 
 
+@lru_cache(maxsize=256)
 def _build_header_pattern(label: str) -> re.Pattern:
     """
     Return a compiled, case-insensitive regex that robustly matches a header label
@@ -265,6 +271,26 @@ def _extract_horizontal_lines(cropped_search_area, ascending=True, consolidate_s
     return [[seg] for seg in normalized]
 
 
+# Allow optional spaces between Month and Day and around commas.
+# Use distinct group names for start/end to avoid regex group redefinition errors.
+_PERIOD_MONTH = r"(?:JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER|" \
+                r"JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|SEPT|OCT|NOV|DEC)"
+_PERIOD_START = rf"(?P<start_month>{_PERIOD_MONTH})\s*(?P<start_day>\d{{1,2}})(?:,?\s*(?P<start_year>\d{{4}}))?"
+_PERIOD_END = rf"(?P<end_month>{_PERIOD_MONTH})\s*(?P<end_day>\d{{1,2}})(?:,?\s*(?P<end_year>\d{{4}}))?"
+# Separator allows: "to", en dash, hyphen, with optional surrounding whitespace
+_PERIOD_RANGE = re.compile(rf"{_PERIOD_START}\s*(?:to|–|-)\s*{_PERIOD_END}", re.IGNORECASE)
+_OCR_DOT_SPACE = re.compile(r"\.\s+")
+_PERIOD_MONTH_NUMBERS = {
+    name: number
+    for number, full in enumerate(
+        ("JANUARY", "FEBRUARY", "MARCH", "APRIL", "MAY", "JUNE", "JULY",
+         "AUGUST", "SEPTEMBER", "OCTOBER", "NOVEMBER", "DECEMBER"),
+        start=1,
+    )
+    for name in (full, full[:3])
+}
+
+
 def detect_statement_period(text: str):
     """
     Detect statement period date range from text using regex patterns and inference logic.
@@ -285,21 +311,9 @@ def detect_statement_period(text: str):
         return None
     
     # Normalize text (handle OCR dots, and spaces)
-    text = re.sub(r"\.\s+", " ", text).replace("\n", " ")
-
-    # Allow optional spaces between Month and Day and around commas.
-    # Use distinct group names for start/end to avoid regex group redefinition errors.
-    month = r"(?:JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER|" \
-            r"JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|SEPT|OCT|NOV|DEC)"
-    start_pat = rf"(?P<start_month>{month})\s*(?P<start_day>\d{{1,2}})(?:,?\s*(?P<start_year>\d{{4}}))?"
-    end_pat = rf"(?P<end_month>{month})\s*(?P<end_day>\d{{1,2}})(?:,?\s*(?P<end_year>\d{{4}}))?"
+    text = _OCR_DOT_SPACE.sub(" ", text).replace("\n", " ")
 
-    # Separator allows: "to", en dash, hyphen, with optional surrounding whitespace
-    sep_pat = r"\s*(?:to|–|-)\s*"
-
-    range_pat = rf"{start_pat}{sep_pat}{end_pat}"
-
-    match = re.search(range_pat, text, re.IGNORECASE)
+    match = _PERIOD_RANGE.search(text)
     if not match:
         return None
 
@@ -316,15 +330,14 @@ def detect_statement_period(text: str):
         if y is None:
             return None
 
-        # Normalize month name to %b or %B compatible parsing
-        mon_norm = mon.strip().title()
-        for fmt in ("%B", "%b"):
-            try:
-                month_num = datetime.strptime(mon_norm, fmt).month
-                return datetime(y, month_num, day)
-            except ValueError:
-                continue
-        return None
+        # Same names strptime's %B/%b accept (so "SEPT" still yields no date)
+        month_num = _PERIOD_MONTH_NUMBERS.get(mon.strip().upper())
+        if month_num is None:
+            return None
+        try:
+            return datetime(y, month_num, day)
+        except ValueError:
+            return None
 
     # End date should ideally contain the year; if not, we can't infer reliably
     end_dt = _build_date("end", fallback_year=None)
@@ -961,6 +974,51 @@ def validate_extracted_table(table_rows: List[List[str | None]], section_config:
     return True
 
 
+def _column_reader(idx: Optional[int]):
+    """Return a row -> cell text function for a fixed column index ("" when absent)."""
+    if idx is None or idx < 0:
+        return lambda row: ""
+
+    def read(row: List[str]) -> str:
+        return row[idx] if idx < len(row) else ""
+    return read
+
+
+# Row-level patterns for parse_rows, compiled once at import instead of per call/row.
+_AMOUNT_TOKEN = re.compile(r"-?\d+(?:\.\d+)?")
+_DATE_LIKE_PATTERNS = (
+    re.compile(r"\b\d{1,2}/\d{1,2}(?:/\d{2,4})?\b"),
+    re.compile(r"\b(?:JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)\.?\s+\d{1,2}\b"),
+)
+_SLASH_DATE = re.compile(r"\b(?P<m>\d{1,2})/(?P<d>\d{1,2})(?:/(?P<y>\d{2,4}))?\b")
+_MONTH_DATE = re.compile(r"\b(?P<mon>JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)\.?\s*(?P<d>\d{1,2})\b")
+_MONTH_NUMBERS = {
+    "JAN": 1, "FEB": 2, "MAR": 3, "APR": 4, "MAY": 5, "JUN": 6,
+    "JUL": 7, "AUG": 8, "SEP": 9, "OCT": 10, "NOV": 11, "DEC": 12
+}
+_NOISE_MARKERS = (
+    "TOTAL",
+    "TOTALS",
+    "SUBTOTAL",
+    "NEW BALANCE",
+    "PREVIOUS STATEMENT BALANCE",
+    "STATEMENT BALANCE",
+    "BALANCE FORWARD",
+    "TOTAL INTEREST",
+    "TOTAL PAYMENTS",
+    "TOTAL CREDITS",
+    "TOTAL CHARGES",
+    "TOTAL PURCHASES",
+    "TOTAL FEES",
+    "NET AMOUNT",
+    "ACCOUNT NUMBER",
+    "CARD NUMBER",
+    "CARD #",
+)
+# One scan of the joined row finds any marker (alternation matches wherever any marker occurs).
+_NOISE_ROW_PATTERN = re.compile("|".join(re.escape(marker) for marker in _NOISE_MARKERS))
+
+
 def parse_rows(table_rows: List[List[str | None]], section_config: Dict, source: str, tax_year: str, *, statement_period: Optional[Dict] = None, rows_only: bool = True, max_header_rows: int = 2,) -> List[Dict]:
     """
     Parse extracted PDF table rows into normalized transaction dicts.
@@ -1046,12 +1104,11 @@ def parse_rows(table_rows: List[List[str | None]], section_config: Dict, source:
         except Exception:
             crosses_year = False
 
-    def _cell(row: List[str], idx: Optional[int]) -> str:
-        if idx is None:
-            return ""
-        return row[idx] if 0 <= idx < len(row) else ""
-
-    _AMT_TOKEN = re.compile(r"-?\d+(?:\.\d+)?")
+    # Column positions are fixed for the whole section: bind each one into its own reader once.
+    tx_date_cell = _column_reader(tx_date_idx)
+    post_date_cell = _column_reader(post_date_idx)
+    desc_cell = _column_reader(desc_idx)
+    amt_cell = _column_reader(amt_idx)
 
     def _parse_amount(s: str) -> Optional[float]:
         if not s:
@@ -1070,7 +1127,7 @@ def parse_rows(table_rows: List[List[str | None]], section_config: Dict, source:
 
         if s_clean.startswith("(") and s_clean.endswith(")"):
             inner = s_clean[1:-1].strip()
-            m = _AMT_TOKEN.search(inner)
+            m = _AMOUNT_TOKEN.search(inner)
             if not m:
                 return None
             try:
@@ -1078,7 +1135,7 @@ def parse_rows(table_rows: List[List[str | None]], section_config: Dict, source:
             except ValueError:
                 return None
 
-        m = _AMT_TOKEN.search(s_clean)
+        m = _AMOUNT_TOKEN.search(s_clean)
         if not m:
             return None
         try:
@@ -1094,37 +1151,14 @@ def parse_rows(table_rows: List[List[str | None]], section_config: Dict, source:
         s = (s or "").upper().strip()
         if not s:
             return False
-        patterns = [
-            r"\b\d{1,2}/\d{1,2}(?:/\d{2,4})?\b",
-            r"\b(?:JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)\.?\s+\d{1,2}\b",
-        ]
-        return any(re.search(p, s) for p in patterns)
+        return any(p.search(s) for p in _DATE_LIKE_PATTERNS)
 
     def _is_total_or_noise_row(row: List[str]) -> bool:
         joined = " ".join(c for c in row if c).strip().upper()
         if not joined:
             return True
 
-        noise_markers = (
-            "TOTAL",
-            "TOTALS",
-            "SUBTOTAL",
-            "NEW BALANCE",
-            "PREVIOUS STATEMENT BALANCE",
-            "STATEMENT BALANCE",
-            "BALANCE FORWARD",
-            "TOTAL INTEREST",
-            "TOTAL PAYMENTS",
-            "TOTAL CREDITS",
-            "TOTAL CHARGES",
-            "TOTAL PURCHASES",
-            "TOTAL FEES",
-            "NET AMOUNT",
-            "ACCOUNT NUMBER",
-            "CARD NUMBER",
-            "CARD #",
-        )
-        if any(m in joined for m in noise_markers):
+        if _NOISE_ROW_PATTERN.search(joined):
             return True
 
         nonempty = [c for c in row if c and c.strip()]
@@ -1136,19 +1170,6 @@ def parse_rows(table_rows: List[List[str | None]], section_config: Dict, source:
 
         return False
 
-    def _is_desc_only_continuation(row: List[str]) -> bool:
-        desc = _cell(row, desc_idx)
-        amt = _parse_amount(_cell(row, amt_idx))
-
-        tx_raw = _cell(row, tx_date_idx)
-        post_raw = _cell(row, post_date_idx)
-
-        has_any_date = _looks_like_date(tx_raw) or _looks_like_date(post_raw)
-        has_desc = bool(desc and desc.strip())
-        has_amount = amt is not None
-
-        return has_desc and (not has_amount) and (not has_any_date)
-
     def _parse_date_iso(raw: str, *, default_year: int) -> Optional[str]:
         """
         Convert a raw date token to ISO YYYY-MM-DD.
@@ -1161,7 +1182,7 @@ def parse_rows(table_rows: List[List[str | None]], section_config: Dict, source:
             return None
 
         # 1) Try MM/DD/YYYY or M/D/YY with optional year
-        m = re.search(r"\b(?P<m>\d{1,2})/(?P<d>\d{1,2})(?:/(?P<y>\d{2,4}))?\b", s)
+        m = _SLASH_DATE.search(s)
         if m:
             mm = int(m.group("m"))
             dd = int(m.group("d"))
@@ -1199,13 +1220,9 @@ def parse_rows(table_rows: List[List[str | None]], section_config: Dict, source:
                 return None
 
         # 2) Try Mon D with optional dot (e.g., "JAN 5" or "JAN. 5")
-        m = re.search(r"\b(?P<mon>JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)\.?\s*(?P<d>\d{1,2})\b", s)
+        m = _MONTH_DATE.search(s)
         if m:
-            mon_map = {
-                "JAN": 1, "FEB": 2, "MAR": 3, "APR": 4, "MAY": 5, "JUN": 6,
-                "JUL": 7, "AUG": 8, "SEP": 9, "OCT": 10, "NOV": 11, "DEC": 12
-            }
-            mm = mon_map.get(m.group("mon"), 0)
+            mm = _MONTH_NUMBERS.get(m.group("mon"), 0)
             dd = int(m.group("d"))
             if mm <= 0:
                 return None
@@ -1235,6 +1252,14 @@ def parse_rows(table_rows: List[List[str | None]], section_config: Dict, source:
 
         return None
 
+    # Statement rows repeat a handful of date tokens; resolve each one once per call.
+    _date_iso_cache: Dict[str, Optional[str]] = {}
+
+    def _date_iso(raw: str) -> Optional[str]:
+        if raw not in _date_iso_cache:
+            _date_iso_cache[raw] = _parse_date_iso(raw, default_year=tax_year_int)
+        return _date_iso_cache[raw]
+
     def _tx_in_tax_year(tx_date_iso: Optional[str]) -> bool:
         """
         For cross-year statements, keep only tx whose transaction_date year == tax_year.
@@ -1256,27 +1281,22 @@ def parse_rows(table_rows: List[List[str | None]], section_config: Dict, source:
         if _is_total_or_noise_row(row):
             continue
 
-        # Continuation rows (multi-line descriptions)
-        if _is_desc_only_continuation(row):
-            if last_tx:
-                extra = _cell(row, desc_idx).strip()
-                if extra:
-                    last_tx["description"] = (last_tx.get("description", "") + " " + extra).strip()
-            continue
-
-        desc = _cell(row, desc_idx).strip()
+        desc = desc_cell(row).strip()
         if not desc:
             continue
 
-        amt_val = _parse_amount(_cell(row, amt_idx))
+        tx_date_raw = tx_date_cell(row)
+        post_date_raw = post_date_cell(row)
+
+        amt_val = _parse_amount(amt_cell(row))
         if amt_val is None:
+            # Continuation rows (multi-line descriptions): text with no amount and no date
+            if last_tx and not (_looks_like_date(tx_date_raw) or _looks_like_date(post_date_raw)):
+                last_tx["description"] = (last_tx.get("description", "") + " " + desc).strip()
             continue
 
-        tx_date_raw = _cell(row, tx_date_idx)
-        post_date_raw = _cell(row, post_date_idx)
-
         # IMPORTANT: Use transaction date for tax-year filtering, not posting date.
-        tx_date_iso = _parse_date_iso(tx_date_raw, default_year=tax_year_int) if tx_date_idx is not None else None
+        tx_date_iso = _date_iso(tx_date_raw) if tx_date_idx is not None else None
 
         # If we expect a transaction date column but couldn't parse it, skip (prevents garbage rows)
         if tx_date_idx is not None and not tx_date_iso:
@@ -1285,7 +1305,7 @@ def parse_rows(table_rows: List[List[str | None]], section_config: Dict, source:
         if not _tx_in_tax_year(tx_date_iso):
             continue
 
-        post_date_iso = _parse_date_iso(post_date_raw, default_year=tax_year_int) if post_date_idx is not None else None
+        post_date_iso = _date_iso(post_date_raw) if post_date_idx is not None else None
 
         tx: Dict[str, object] = {
             "transaction_date": tx_date_iso,
@@ -1703,19 +1723,77 @@ def parse_pdf(pdf_path: pathlib.Path, bank: str, tax_year: Optional[int] = None)
     return normalized
 
 
+def _init_parse_worker(use_logging: bool, log_level: int) -> None:
+    """Give a worker process the parent's notify() routing; spawned workers start with defaults."""
+    src.utils.use_logging = use_logging
+    if use_logging and not logging.getLogger().handlers:
+        logging.basicConfig(level=log_level, format="%(asctime)s [%(levelname)s] %(message)s")
+
+
+def _parse_pdfs(pdf_paths: List[pathlib.Path], bank: str, tax_year: Optional[int] = None, workers: Optional[int] = None):
+    """
+    Yield (pdf_path, transactions) for each PDF in input order.
+
+    Files are parsed inline unless workers > 1 is passed: starting a process pool
+    costs more than parsing the handful of statements a typical year has. With
+    workers > 1, pdfplumber parsing (CPU-bound, no state across files) is spread
+    over that many processes.
+    """
+    pdf_paths = list(pdf_paths)
+    workers = min(workers or 1, len(pdf_paths))
+    if workers <= 1:
+        for pdf_path in pdf_paths:
+            yield pdf_path, parse_pdf(pdf_path, bank, tax_year=tax_year)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_parse_worker,
+        initargs=(src.utils.use_logging, logging.getLogger().getEffectiveLevel()),
+    ) as pool:
+        results = pool.map(parse_pdf, pdf_paths, [bank] * len(pdf_paths), [tax_year] * len(pdf_paths))
+        yield from zip(pdf_paths, results)
+
+
+def parse_many(pdf_paths: List[pathlib.Path], bank: str, tax_year: Optional[int] = None, workers: Optional[int] = None) -> List[Dict]:
+    """
+    Parse several statement PDFs of one bank, optionally across worker processes.
+
+    Args:
+        pdf_paths (list[Path]): PDFs to parse.
+        bank (str): Bank identifier.
+        tax_year (int, optional): Tax year used to resolve statement dates.
+        workers (int, optional): Process count; parsed inline unless > 1 (default).
+
+    Returns:
+        list[dict]: Transactions of all PDFs, in input file order.
+    """
+    return [tx for _, transactions in _parse_pdfs(pdf_paths, bank, tax_year, workers) for tx in transactions]
+
+
+_TD_CSV_FOOTERS = frozenset({"PREVIOUS STATEMENT BALANCE", "TOTAL NEW BALANCE"})
+
+
+@lru_cache(maxsize=512)
+def _td_csv_date_iso(raw: str) -> str:
+    """MM/DD/YYYY -> YYYY-MM-DD; a statement repeats few dates, so each is parsed once."""
+    return datetime.strptime(raw, "%m/%d/%Y").strftime("%Y-%m-%d")
+
+
 def parse_csv(file_path: pathlib.Path, profile: dict):
     """
     Parse TD Visa CSV statement into normalized transactions.
     """
     transactions = []
-    
+    source = profile["bank_name"]
+
     with open(file_path, "r") as f:
         for line in f:
             row = line.strip().split(",")
             if not row or len(row) < 5:
                 continue
 
-            tx_date = datetime.strptime(row[0], "%m/%d/%Y").strftime("%Y-%m-%d")
+            tx_date = _td_csv_date_iso(row[0])
             desc = row[1].strip()
             debit = float(row[2]) if row[2] else 0.0
             credit = float(row[3]) if row[3] else 0.0
@@ -1723,7 +1801,7 @@ def parse_csv(file_path: pathlib.Path, profile: dict):
             balance = float(row[4]) if row[4] else None
 
             # Skip footer rows
-            if desc in ["PREVIOUS STATEMENT BALANCE", "TOTAL NEW BALANCE"]:
+            if desc in _TD_CSV_FOOTERS:
                 continue
 
             transactions.append({
@@ -1731,13 +1809,16 @@ def parse_csv(file_path: pathlib.Path, profile: dict):
                 "description": desc,
                 "amount": amount,
                 "balance": balance,
-                "source": profile["bank_name"],
+                "source": source,
                 "section": "Transactions"
             })
     
     return transactions
 
 
+_EXPORT_FIELDS = ("transaction_date", "posting_date", "description", "amount", "source", "section")
+
+
 def export_csv(transactions, out_path: pathlib.Path):
     """
     Write transactions to CSV.
@@ -1749,30 +1830,34 @@ def export_csv(transactions, out_path: pathlib.Path):
     out_path.parent.mkdir(parents=True, exist_ok=True)
     try:
         with open(out_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["transaction_date","posting_date","description","amount","source","section"])
-            writer.writeheader()
-            for tx in transactions:
-                writer.writerow(tx)
+            writer = csv.writer(f)
+            writer.writerow(_EXPORT_FIELDS)
+            # Project each tx onto the fixed column order; missing keys export as "" like DictWriter's restval.
+            writer.writerows([tx.get(field, "") for field in _EXPORT_FIELDS] for tx in transactions)
         notify("Exported %d transactions to %s" % (len(transactions), out_path), "info")
     except Exception as e:
         notify("Failed to export CSV %s: %s" % (out_path, e), "error")
 
 
-def ingest_year(year: str, bank: str = "triangle"):
+def ingest_year(year: str, bank: str = "triangle", workers: Optional[int] = None):
     """
     Main entrypoint: discover, normalize, parse, and export all PDFs for a tax year.
 
+    Every discovered PDF is renamed by normalize_filename before any of them is
+    parsed, so the files can then be handed to worker processes together. A parse
+    failure therefore leaves all files of the year already renamed.
+
     Args:
         year (str): Tax year (e.g., '2024').
         bank (str): Bank identifier (default 'triangle').
+        workers (int, optional): Parse across this many processes; inline unless > 1.
     """
     pdfs = discover_pdfs(f"./data/{year}/")
     all_tx = []
     tax_year = int(year)
     
-    for pdf in pdfs:
-        normalized_pdf = normalize_filename(pdf, bank)
-        tx = parse_pdf(normalized_pdf, bank, tax_year=tax_year)
+    normalized_pdfs = [normalize_filename(pdf, bank) for pdf in pdfs]
+    for normalized_pdf, tx in _parse_pdfs(normalized_pdfs, bank, tax_year=tax_year, workers=workers):
         export_csv(tx, pathlib.Path(f"./output/{year}/{bank}/{normalized_pdf.stem}.csv"))
         all_tx.extend(tx)
         
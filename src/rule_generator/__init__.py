@@ -1,7 +1,13 @@
 """Exports for the rule generator package."""
 
 from .core import RuleWizard
-from .rule_evaluator import evaluate_rule
+from .rule_evaluator import (
+    PreparedTransactions,
+    compile_rule_predicate,
+    compile_rules,
+    evaluate_rule,
+    prepare_transactions,
+)
 from .rules_io import load_rules, save_rules
 from .schema import (
     ValidationIssue,
@@ -22,5 +28,9 @@ __all__ = [
     "load_rules",
     "save_rules",
     "evaluate_rule",
+    "compile_rule_predicate",
+    "compile_rules",
+    "prepare_transactions",
+    "PreparedTransactions",
     "RuleWizard",
 ]
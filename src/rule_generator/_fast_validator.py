@@ -0,0 +1,93 @@
+"""Optional fastjsonschema gate used ahead of the full jsonschema error walk."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, Optional
+
+from src._generated import get_pregenerated_validator, schema_digest
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional dependency
+    fastjsonschema = None  # type: ignore[assignment]
+
+FastValidator = Callable[[Any], Any]
+
+# Keyed by the canonical JSON text of the schema: callers usually reload the
+# schema from disk, so object identity would miss on every call.
+_COMPILED: Dict[str, Optional[FastValidator]] = {}
+
+
+def get_fast_validator(schema: Dict[str, Any]) -> Optional[FastValidator]:
+    """Return a compiled fastjsonschema callable for schema, or None if unavailable."""
+
+    if fastjsonschema is None:
+        return None
+
+    key = json.dumps(schema, sort_keys=True)
+    if key not in _COMPILED:
+        # Shipped schemas have an ahead-of-time module; anything else compiles here.
+        pregenerated = get_pregenerated_validator(schema_digest(schema))
+        if pregenerated is not None:
+            _COMPILED[key] = pregenerated
+            return pregenerated
+        try:
+            # use_default=False: validating must never write schema defaults into the document.
+            _COMPILED[key] = fastjsonschema.compile(schema, use_default=False)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            # Let jsonschema report the schema problem with its own diagnostics.
+            _COMPILED[key] = None
+    return _COMPILED[key]
+
+
+def passes_fast_gate(instance: Any, schema: Dict[str, Any]) -> bool:
+    """Return True only when the compiled validator accepts instance.
+
+    False means "unknown": either the instance is invalid or the fast backend
+    is unavailable, and the caller should run the full error walker.
+    """
+
+    return accepts(get_fast_validator(schema), instance)
+
+
+# Types json.loads can produce; only these are judged the same way by both backends.
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_json_shaped(instance: Any) -> bool:
+    """True when instance holds only JSON-decoded types (dicts with str keys, lists, scalars).
+
+    fastjsonschema also treats tuples as arrays and Decimals as numbers, while
+    jsonschema rejects them, so anything else must take the full validator.
+    """
+
+    stack = [instance]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is dict:
+            if not all(type(key) is str for key in item):
+                return False
+            stack.extend(item.values())
+        elif kind is list:
+            stack.extend(item)
+        elif kind not in _JSON_SCALARS:
+            return False
+    return True
+
+
+def accepts(validator: Optional[FastValidator], instance: Any) -> bool:
+    """Run an already looked-up fast validator; None (no backend) never accepts.
+
+    Instances that are not plain JSON data are never accepted here, so the
+    caller falls through to jsonschema, which has the final say on them.
+    """
+
+    if validator is None or not _is_json_shaped(instance):
+        return False
+    try:
+        validator(instance)
+    except fastjsonschema.JsonSchemaException:
+        return False
+    return True
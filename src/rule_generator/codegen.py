@@ -0,0 +1,46 @@
+"""Generate a specialized Python predicate for a compiled rule."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Tuple
+
+RulePredicate = Callable[[Dict[str, Any]], bool]
+
+
+def _emit_items(items: List[Any], want_all: bool, namespace: Dict[str, Any], names: Dict[int, str]) -> str:
+    if not items:
+        return "False"
+
+    parts: List[str] = []
+    for item in items:
+        if len(item) == 2:
+            parts.append(_emit_items(item[1], item[0], namespace, names))
+            continue
+        op_fn, field_name, expected_value = item
+        fn_name = names.get(id(op_fn))
+        if fn_name is None:
+            fn_name = names[id(op_fn)] = f"_op{len(names)}"
+            namespace[fn_name] = op_fn
+        # Expected values may be tuples or compiled patterns, so they are bound by name, not inlined.
+        value_name = f"_v{len(namespace)}"
+        namespace[value_name] = expected_value
+        parts.append(f"{fn_name}(get({field_name!r}), {value_name})")
+
+    # and/or short-circuit exactly like the ALL/ANY semantics of the rule DSL.
+    return "(" + (" and " if want_all else " or ").join(parts) + ")"
+
+
+def generate_predicate(root: Tuple[bool, List[Any]]) -> RulePredicate:
+    """Turn a compiled (match_all, items) rule tree into a straight-line row predicate.
+
+    The tree is unrolled into a single boolean expression over direct operator
+    calls, so evaluating a row costs no tree walk or dispatch loop.
+    """
+
+    namespace: Dict[str, Any] = {}
+    expression = _emit_items(root[1], root[0], namespace, {})
+    source = f"def _match(tx):\n    get = tx.get\n    return bool({expression})\n"
+    exec(compile(source, "<rule predicate>", "exec"), namespace)
+    predicate = namespace["_match"]
+    predicate.__source__ = source  # kept for debugging generated rules
+    return predicate
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterable, List, Optional, TypedDict
 
-from .rule_evaluator import evaluate_rule, MatchReport
+from .rule_evaluator import PreparedTransactions, evaluate_rule, MatchReport
 from .schema import ValidationResult, validate_rule_block
 
 
@@ -117,9 +117,12 @@ class RuleWizard:
 
         match_report: Optional[MatchReport] = None
         if dry_run_transactions is not None and (validation is None or validation["valid"]):
+            # Prepared rows keep their shared column cache; anything else is materialized once.
+            if not isinstance(dry_run_transactions, PreparedTransactions):
+                dry_run_transactions = list(dry_run_transactions)
             match_report = self._evaluator(
                 rule,
-                list(dry_run_transactions),
+                dry_run_transactions,
                 expected_matches=expected_matches,
             )
 
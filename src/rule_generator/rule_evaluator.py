@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+import json
+import re
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Sequence, Set, Tuple, Union
+
+from .codegen import RulePredicate, generate_predicate
+
+_NAN = float("nan")
 
 MatchReport = Dict[str, List[Dict[str, Any]]]
+CompiledCondition = Tuple[Callable[[Any, Any], bool], str, Any]
+# (match_all, compiled items); told apart from conditions by its length
+CompiledGroup = Tuple[bool, List[Any]]
+CompiledItem = Union[CompiledCondition, CompiledGroup]
 
 
 def _normalize_string(value: Any) -> Optional[str]:
@@ -13,88 +25,406 @@ def _normalize_string(value: Any) -> Optional[str]:
     return str(value)
 
 
-def _op_contains(field_value: Any, expected: Any) -> bool:
+def _lower_or_none(value: Any) -> Optional[str]:
+    normalized = _normalize_string(value)
+    return normalized.lower() if normalized is not None else None
+
+
+def _float_or_none(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except Exception:
+        return None
+
+
+def _float_or_nan(value: Any) -> float:
+    # NaN compares False against everything, so numeric kernels need no missing-value test.
+    try:
+        return float(value)
+    except Exception:
+        return _NAN
+
+
+def _float_range_expected(value: Any) -> Optional[Tuple[float, float]]:
+    try:
+        low, high = value
+        return float(low), float(high)
+    except Exception:
+        return None
+
+
+def _regex_or_none(value: Any) -> Optional[Pattern[str]]:
+    # Compiled once per rule; an invalid pattern never matches, as in the legacy engine.
+    if not isinstance(value, str):
+        return None
+    try:
+        return re.compile(value)
+    except re.error:
+        return None
+
+
+def _text_or_empty(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _op_contains(field_value: Any, expected: Optional[str]) -> bool:
     if field_value is None or expected is None:
         return False
-    return expected.lower() in field_value.lower()
+    return expected in str(field_value).lower()
 
 
-def _op_starts_with(field_value: Any, expected: Any) -> bool:
+def _op_starts_with(field_value: Any, expected: Optional[str]) -> bool:
     if field_value is None or expected is None:
         return False
-    return field_value.lower().startswith(expected.lower())
+    return str(field_value).lower().startswith(expected)
 
 
-def _op_equals(field_value: Any, expected: Any) -> bool:
+def _op_equals(field_value: Any, expected: Optional[str]) -> bool:
     if field_value is None and expected is None:
         return True
     if field_value is None or expected is None:
         return False
-    field_str = _normalize_string(field_value)
-    expected_str = _normalize_string(expected)
-    if field_str is None or expected_str is None:
-        return False
-    return field_str.lower() == expected_str.lower()
+    return str(field_value).lower() == expected
 
 
-def _op_between(field_value: Any, expected: Any) -> bool:
+def _op_between(field_value: Any, expected: Optional[Tuple[float, float]]) -> bool:
+    if expected is None:
+        return False
     try:
         low, high = expected
-        return float(low) <= float(field_value) <= float(high)
+        return low <= float(field_value) <= high
     except Exception:
         return False
 
 
-def _op_lte(field_value: Any, expected: Any) -> bool:
+def _op_lte(field_value: Any, expected: Optional[float]) -> bool:
+    if expected is None:
+        return False
     try:
-        return float(field_value) <= float(expected)
+        return float(field_value) <= expected
     except Exception:
         return False
 
 
-_OPERATOR_DISPATCH = {
-    "CONTAINS": _op_contains,
-    "STARTS_WITH": _op_starts_with,
-    "EQUALS": _op_equals,
-    "BETWEEN": _op_between,
-    "LESS_THAN_OR_EQUAL_TO": _op_lte,
-}
+def _op_contains_any(field_value: Any, expected: Optional[Pattern[str]]) -> bool:
+    if field_value is None or expected is None:
+        return False
+    return expected.search(str(field_value).lower()) is not None
 
 
-def _evaluate_condition(condition: Dict[str, Any], transaction: Dict[str, Any]) -> bool:
-    operator = condition.get("operator")
-    if operator not in _OPERATOR_DISPATCH:
+def _op_regex(field_value: Any, expected: Optional[Pattern[str]]) -> bool:
+    if expected is None:
         return False
+    return expected.search(_text_or_empty(field_value)) is not None
+
+
+def _op_never(field_value: Any, expected: Any) -> bool:
+    return False
+
+
+# operator -> (operator fn, one-time normalizer for the expected value)
+_OPERATOR_DISPATCH = {
+    "CONTAINS": (_op_contains, _lower_or_none),
+    "STARTS_WITH": (_op_starts_with, _lower_or_none),
+    "EQUALS": (_op_equals, _lower_or_none),
+    "BETWEEN": (_op_between, _float_range_expected),
+    "LESS_THAN_OR_EQUAL_TO": (_op_lte, _float_or_none),
+    "REGEX": (_op_regex, _regex_or_none),
+}
 
+
+def _compile_condition(condition: Dict[str, Any]) -> CompiledCondition:
     field_name = condition.get("field")
-    if not isinstance(field_name, str):
-        return False
-    field_value = transaction.get(field_name)
-    expected_value = condition.get("value")
+    dispatch = _OPERATOR_DISPATCH.get(condition.get("operator"))
+    if dispatch is None or not isinstance(field_name, str):
+        return (_op_never, "", None)
+
+    op_fn, normalize_expected = dispatch
+    # Interned field names let dict lookups on transactions built from the same
+    # (interned) column names hit CPython's identity fast path.
+    return (op_fn, sys.intern(field_name), normalize_expected(condition.get("value")))
+
 
-    return _OPERATOR_DISPATCH[operator](field_value, expected_value)
+def _merge_contains_needles(items: List[CompiledItem]) -> List[CompiledItem]:
+    """Fold sibling CONTAINS conditions on one field into a single alternation search.
+
+    Only valid under MUST_MATCH_ANY: "any needle occurs" is one regex scan of the
+    value instead of one substring scan per needle.
+    """
+
+    needles: Dict[str, List[str]] = {}
+    for item in items:
+        if len(item) == 3 and item[0] is _op_contains and item[2] is not None:
+            needles.setdefault(item[1], []).append(item[2])
 
+    merged_fields = {field_name for field_name, values in needles.items() if len(values) > 1}
+    if not merged_fields:
+        return items
 
-def _evaluate_rule_items(items: List[Dict[str, Any]], transaction: Dict[str, Any], logic: str) -> bool:
-    results: List[bool] = []
+    merged: List[CompiledItem] = []
     for item in items:
+        if len(item) == 3 and item[0] is _op_contains and item[1] in merged_fields:
+            field_name = item[1]
+            if item[2] is None:
+                continue  # never matches; dropping it cannot change an ANY result
+            if field_name in needles:
+                pattern = re.compile("|".join(re.escape(needle) for needle in needles.pop(field_name)))
+                merged.append((_op_contains_any, field_name, pattern))
+            continue
+        merged.append(item)
+    return merged
+
+
+# Rough per-row cost of each operator: numeric compares are cheapest, substring
+# scans and regex searches the most expensive.
+_OPERATOR_COST = {
+    _op_never: 0,
+    _op_lte: 1,
+    _op_between: 2,
+    _op_equals: 3,
+    _op_starts_with: 3,
+    _op_contains: 10,
+    _op_contains_any: 12,
+    _op_regex: 15,
+}
+
+
+def _cost_of(item: CompiledItem) -> int:
+    """Estimate what evaluating a compiled item costs per row (a group costs the sum of its children)."""
+    if len(item) == 2:
+        return sum(_cost_of(child) for child in item[1])
+    return _OPERATOR_COST.get(item[0], 10)
+
+
+def _compile_items(items: List[Any], want_all: bool) -> List[CompiledItem]:
+    compiled: List[CompiledItem] = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError(f"Rule items must be objects, got {type(item).__name__}: {item!r}")
         if "group_logic" in item:
-            group_logic = item.get("group_logic", "MUST_MATCH_ANY")
             group_rules = item.get("rules", [])
-            if not isinstance(group_rules, list) or not group_rules:
-                results.append(False)
-                continue
-            group_result = _evaluate_rule_items(group_rules, transaction, group_logic)
-            results.append(group_result)
+            group_all = item.get("group_logic") == "MUST_MATCH_ALL"
+            # A malformed (non-list) group compiles to an empty one, which never matches.
+            compiled.append(
+                (group_all, _compile_items(group_rules, group_all) if isinstance(group_rules, list) else [])
+            )
         else:
-            results.append(_evaluate_condition(item, transaction))
+            compiled.append(_compile_condition(item))
+    if not want_all:
+        compiled = _merge_contains_needles(compiled)
+    # ALL/ANY results do not depend on item order, so run the cheap checks first
+    # and let short-circuiting skip the substring scans on most rows.
+    compiled.sort(key=_cost_of)
+    return compiled
 
-    if not results:
-        return False
 
-    if logic == "MUST_MATCH_ALL":
-        return all(results)
-    return any(results)
+def _compile_rule(rule: Dict[str, Any]) -> CompiledGroup:
+    """Validate the rule's shape and normalize every expected value once, ahead of the transaction loop.
+
+    Returns the root group. Anything other than MUST_MATCH_ALL evaluates as
+    MUST_MATCH_ANY, as before; rule items that are not objects raise ValueError.
+    """
+
+    items = rule.get("rules", [])
+    if not isinstance(items, list):
+        raise ValueError(f"Rule 'rules' must be a list, got {type(items).__name__}")
+    want_all = rule.get("logic") == "MUST_MATCH_ALL"
+    return (want_all, _compile_items(items, want_all))
+
+
+def _rule_cache_key(rule: Dict[str, Any]) -> Optional[str]:
+    try:
+        return json.dumps(rule, sort_keys=True)
+    except (TypeError, ValueError):
+        return None  # not plain JSON data; compile without caching
+
+
+@lru_cache(maxsize=1024)
+def _cached_predicate(rule_key: str) -> RulePredicate:
+    return generate_predicate(_compile_rule(json.loads(rule_key)))
+
+
+def compile_rule_predicate(rule: Dict[str, Any]) -> RulePredicate:
+    """Return a generated row predicate for rule, reused for identical rule JSON."""
+
+    rule_key = _rule_cache_key(rule)
+    if rule_key is None:
+        return generate_predicate(_compile_rule(rule))
+    return _cached_predicate(rule_key)
+
+
+def compile_rules(rules: Any) -> List[RulePredicate]:
+    """Compile a rules document (or a plain list of rule blocks) to one predicate per rule, in file order."""
+
+    rule_blocks = rules.get("_rules", []) if isinstance(rules, dict) else rules
+    return [compile_rule_predicate(rule) for rule in rule_blocks]
+
+
+def _select_contains(values: List[Optional[str]], candidates: List[int], expected: Optional[str]) -> List[int]:
+    if expected is None:
+        return []
+    return [i for i in candidates if values[i] is not None and expected in values[i]]
+
+
+def _select_starts_with(values: List[Optional[str]], candidates: List[int], expected: Optional[str]) -> List[int]:
+    if expected is None:
+        return []
+    return [i for i in candidates if values[i] is not None and values[i].startswith(expected)]
+
+
+def _select_equals(values: List[Optional[str]], candidates: List[int], expected: Optional[str]) -> List[int]:
+    return [i for i in candidates if values[i] == expected]
+
+
+def _select_between(values: List[float], candidates: List[int], expected: Optional[Tuple[float, float]]) -> List[int]:
+    if expected is None:
+        return []
+    low, high = expected
+    return [i for i in candidates if low <= values[i] <= high]
+
+
+def _select_lte(values: List[float], candidates: List[int], expected: Optional[float]) -> List[int]:
+    if expected is None:
+        return []
+    return [i for i in candidates if values[i] <= expected]
+
+
+def _select_contains_any(
+    values: List[Optional[str]], candidates: List[int], expected: Optional[Pattern[str]]
+) -> List[int]:
+    if expected is None:
+        return []
+    search = expected.search
+    return [i for i in candidates if values[i] is not None and search(values[i]) is not None]
+
+
+def _select_regex(values: List[str], candidates: List[int], expected: Optional[Pattern[str]]) -> List[int]:
+    if expected is None:
+        return []
+    search = expected.search
+    return [i for i in candidates if search(values[i]) is not None]
+
+
+def _select_never(values: Any, candidates: List[int], expected: Any) -> List[int]:
+    return []
+
+
+# operator fn -> (column selector, normalized column kind it reads)
+_COLUMN_KERNELS = {
+    _op_contains: (_select_contains, "lower"),
+    _op_contains_any: (_select_contains_any, "lower"),
+    _op_starts_with: (_select_starts_with, "lower"),
+    _op_equals: (_select_equals, "lower"),
+    _op_between: (_select_between, "float"),
+    _op_lte: (_select_lte, "float"),
+    _op_regex: (_select_regex, "text"),
+    _op_never: (_select_never, "raw"),
+}
+
+_COLUMN_NORMALIZERS: Dict[str, Callable[[Any], Any]] = {
+    "lower": _lower_or_none,
+    "float": _float_or_nan,
+    "text": _text_or_empty,
+    "raw": lambda value: value,
+}
+
+
+class _Columns:
+    """Normalized per-field columns over a transaction sequence, built lazily once per field."""
+
+    def __init__(self, transactions: Sequence[Dict[str, Any]], *, share_hits: bool = False) -> None:
+        self._transactions = transactions
+        self._cache: Dict[Tuple[str, str], List[Any]] = {}
+        # With share_hits, each distinct condition is scanned over the whole column once
+        # and its matching rows reused by every rule that repeats it.
+        self.share_hits = share_hits
+        self._hits: Dict[CompiledCondition, Set[int]] = {}
+
+    def get(self, kind: str, field_name: str) -> List[Any]:
+        key = (kind, field_name)
+        column = self._cache.get(key)
+        if column is None:
+            normalize = _COLUMN_NORMALIZERS[kind]
+            column = [normalize(tx.get(field_name)) for tx in self._transactions]
+            self._cache[key] = column
+        return column
+
+    def hits(self, condition: CompiledCondition) -> Set[int]:
+        matched = self._hits.get(condition)
+        if matched is None:
+            op_fn, field_name, expected_value = condition
+            select, kind = _COLUMN_KERNELS[op_fn]
+            everything = list(range(len(self._transactions)))
+            matched = self._hits[condition] = set(select(self.get(kind, field_name), everything, expected_value))
+        return matched
+
+
+class PreparedTransactions(Sequence[Dict[str, Any]]):
+    """Transactions plus a normalized column cache shared by every rule evaluated over them.
+
+    Build one with prepare_transactions() when running many rules over the same
+    rows: each referenced field is then lower-cased (or parsed as a number)
+    once in total instead of once per rule, and a condition repeated across
+    rules (the same merchant needle, say) is only scanned once.
+    """
+
+    def __init__(self, transactions: Iterable[Dict[str, Any]]) -> None:
+        self._rows: List[Dict[str, Any]] = list(transactions)
+        self.columns = _Columns(self._rows, share_hits=True)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        return self._rows[index]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+def prepare_transactions(transactions: Iterable[Dict[str, Any]]) -> PreparedTransactions:
+    """Wrap transactions so repeated evaluate_rule calls share normalized columns."""
+
+    if isinstance(transactions, PreparedTransactions):
+        return transactions
+    return PreparedTransactions(transactions)
+
+
+def _select_item(item: CompiledItem, columns: _Columns, candidates: List[int]) -> List[int]:
+    if len(item) == 2:
+        group_all, group_items = item
+        return _select_items(group_items, columns, candidates, group_all)
+
+    if columns.share_hits:
+        hits = columns.hits(item)
+        return [i for i in candidates if i in hits]
+
+    op_fn, field_name, expected_value = item
+    select, kind = _COLUMN_KERNELS[op_fn]
+    return select(columns.get(kind, field_name), candidates, expected_value)
+
+
+def _select_items(items: List[CompiledItem], columns: _Columns, candidates: List[int], want_all: bool) -> List[int]:
+    """Return the (ordered) subset of candidate row indexes for which all/any of items hold."""
+
+    if not items:
+        return []
+
+    if want_all:
+        # Each item only sees rows that survived the previous ones.
+        for item in items:
+            candidates = _select_item(item, columns, candidates)
+            if not candidates:
+                break
+        return candidates
+
+    matched: Set[int] = set()
+    remaining = candidates
+    for item in items:
+        hits = _select_item(item, columns, remaining)
+        if hits:
+            matched.update(hits)
+            remaining = [i for i in remaining if i not in matched]
+            if not remaining:
+                break
+    return [i for i in candidates if i in matched]
 
 
 def evaluate_rule(
@@ -103,34 +433,39 @@ def evaluate_rule(
     *,
     expected_matches: Optional[Iterable[int]] = None,
 ) -> MatchReport:
-    """Apply a single rule block to transactions and produce a match report."""
+    """Apply a single rule block to transactions and produce a match report.
 
-    logic = rule.get("logic", "MUST_MATCH_ANY")
-    items = rule.get("rules", [])
-
-    matches: List[Dict[str, Any]] = []
-    matched_indexes: List[int] = []
+    transactions may be any iterable. Without expected_matches a one-shot
+    iterable is streamed row by row; with it, the input is materialized once
+    so false positives/negatives can be looked up by index.
+    """
 
-    for idx, tx in enumerate(transactions):
-        if _evaluate_rule_items(items, tx, logic):
-            matches.append(tx)
-            matched_indexes.append(idx)
+    expected = set(expected_matches or ())
 
-    expected = set(expected_matches or [])
-    matched = set(matched_indexes)
+    if expected and not isinstance(transactions, Sequence):
+        # False positives/negatives are looked up by index afterwards.
+        transactions = list(transactions)
 
-    false_positives: List[Dict[str, Any]] = []
-    false_negatives: List[Dict[str, Any]] = []
-
-    if expected:
-        for idx, tx in enumerate(transactions):
-            if idx in matched and idx not in expected:
-                false_positives.append(tx)
-            if idx in expected and idx not in matched:
-                false_negatives.append(tx)
+    matched_indexes: List[int] = []
+    if isinstance(transactions, Sequence):
+        # Column-at-a-time: normalize each referenced field once, then filter row indexes per condition.
+        want_all, items = _compile_rule(rule)
+        columns = transactions.columns if isinstance(transactions, PreparedTransactions) else _Columns(transactions)
+        matched_indexes = _select_items(items, columns, list(range(len(transactions))), want_all)
+        matches: List[Dict[str, Any]] = [transactions[idx] for idx in matched_indexes]
+    else:
+        # Streaming: no expected set to diff against, so row indexes are not tracked.
+        predicate = compile_rule_predicate(rule)
+        matches = [tx for tx in transactions if predicate(tx)]
+
+    if not expected:
+        return {"matches": matches, "false_positives": [], "false_negatives": []}
 
+    matched = set(matched_indexes)
     return {
         "matches": matches,
-        "false_positives": false_positives,
-        "false_negatives": false_negatives,
+        "false_positives": [transactions[idx] for idx in sorted(matched - expected)],
+        "false_negatives": [
+            transactions[idx] for idx in sorted(expected - matched) if 0 <= idx < len(transactions)
+        ],
     }
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import math
 import os
 from pathlib import Path
 from tempfile import NamedTemporaryFile
@@ -10,6 +11,11 @@ from typing import Any, Dict, Optional
 
 from .schema import ValidationResult, validate_rules_document
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 DEFAULT_RULES_PATH = Path("config") / "allocation_rules.json"
 
 
@@ -19,19 +25,58 @@ def load_rules(path: Optional[Path] = None) -> Dict[str, Any]:
     rules_path = Path(path) if path else DEFAULT_RULES_PATH
     if not rules_path.exists():
         raise FileNotFoundError(f"Rules file not found: {rules_path}")
-    return json.loads(rules_path.read_text(encoding="utf-8"))
+    data = rules_path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity literals, which stdlib json writes and reads
+            pass
+    return json.loads(data.decode("utf-8"))
+
+
+def _has_non_finite(content: Any) -> bool:
+    """True if content holds a NaN or infinite float anywhere (orjson would write it as null)."""
+
+    stack = [content]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
 
+def _dump_json_bytes(content: Dict[str, Any]) -> bytes:
+    """Serialize rules with 2-space indentation, preferring orjson when installed."""
 
-def _atomic_write_json(target: Path, content: Dict[str, Any]) -> None:
-    """Write JSON content atomically to avoid partial writes."""
+    if orjson is not None and not _has_non_finite(content):
+        try:
+            return orjson.dumps(content, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. non-string keys or out-of-range ints; stdlib json handles these
+            pass
+    return json.dumps(content, indent=2, separators=(',', ': '), ensure_ascii=False).encode("utf-8")
+
+
+def _atomic_write_json(target: Path, content: Dict[str, Any], *, fsync: bool = True) -> None:
+    """Write JSON content atomically to avoid partial writes.
+
+    With fsync=False the rename is still atomic, but the data is left to the
+    OS page cache; use it for intermediate or throwaway saves.
+    """
 
     target.parent.mkdir(parents=True, exist_ok=True)
-    with NamedTemporaryFile(
-        "w", encoding="utf-8", delete=False, dir=str(target.parent), newline=""
-    ) as tmp:
-        json.dump(content, tmp, indent=2, separators=(', ', ': '))
+    payload = _dump_json_bytes(content)
+    with NamedTemporaryFile("wb", delete=False, dir=str(target.parent)) as tmp:
+        tmp.write(payload)
         tmp.flush()
-        os.fsync(tmp.fileno())
+        if fsync:
+            os.fsync(tmp.fileno())
         temp_name = tmp.name
     os.replace(temp_name, target)
 
@@ -42,8 +87,13 @@ def save_rules(
     path: Optional[Path] = None,
     validate_before_save: bool = False,
     schema_path: Optional[Path] = None,
+    fsync: bool = True,
 ) -> Optional[ValidationResult]:
-    """Save rules to disk. Optionally validate before writing."""
+    """Save rules to disk. Optionally validate before writing.
+
+    Pass fsync=False to skip the disk sync for saves that do not need to be
+    durable (e.g. scratch copies written by tests or intermediate versions).
+    """
 
     rules_path = Path(path) if path else DEFAULT_RULES_PATH
 
@@ -53,5 +103,5 @@ def save_rules(
         if not validation_result["valid"]:
             return validation_result
 
-    _atomic_write_json(rules_path, rules)
+    _atomic_write_json(rules_path, rules, fsync=fsync)
     return validation_result
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, TypedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypedDict
 from jsonschema.validators import validator_for
 
+from ._fast_validator import FastValidator, accepts, get_fast_validator
+
 DEFAULT_SCHEMA_PATH = Path("config") / "schemas" / "rule_schema.json"
 
 
@@ -31,13 +35,26 @@ def load_rule_schema(path: Optional[Path] = None) -> Dict[str, Any]:
     return json.loads(schema_path.read_text(encoding="utf-8"))
 
 
+# Built validators keyed by the canonical JSON of (schema, fragment). Callers
+# usually reload the schema from disk, so object identity would never hit.
+_VALIDATORS: Dict[str, Any] = {}
+
+
 def _build_validator(schema: Dict[str, Any], schema_fragment: Optional[Dict[str, Any]] = None):
-    """Create a jsonschema Validator.
+    """Return a (cached) jsonschema Validator.
 
     For validating schema fragments that reference local definitions, inline
     the root schema's $defs / definitions into the fragment so local $refs
     resolve without using the deprecated RefResolver.
     """
+    key = json.dumps([schema, schema_fragment], sort_keys=True)
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        validator = _VALIDATORS[key] = _create_validator(schema, schema_fragment)
+    return validator
+
+
+def _create_validator(schema: Dict[str, Any], schema_fragment: Optional[Dict[str, Any]]):
     ValidatorClass = validator_for(schema)
     ValidatorClass.check_schema(schema)
 
@@ -57,6 +74,25 @@ def _build_validator(schema: Dict[str, Any], schema_fragment: Optional[Dict[str,
     return ValidatorClass(fragment)
 
 
+@lru_cache(maxsize=8)
+def _schema_file_validators(path: str, mtime_ns: int) -> Tuple[Any, Optional[FastValidator]]:
+    """Full and fast validators for one version of a schema file, built once."""
+    schema = load_rule_schema(Path(path))
+    return _build_validator(schema), get_fast_validator(schema)
+
+
+def _validators_for(schema: Optional[Dict[str, Any]], schema_path: Optional[Path]) -> Tuple[Any, Optional[FastValidator]]:
+    """Resolve validators for an explicit schema, or for the schema file (cached until it changes)."""
+    if schema:
+        return _build_validator(schema), get_fast_validator(schema)
+    path = Path(schema_path) if schema_path else DEFAULT_SCHEMA_PATH
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Rule schema not found: {path}") from None
+    return _schema_file_validators(os.path.abspath(path), mtime_ns)
+
+
 def _format_error_path(parts: Iterable[Any]) -> str:
     """Render a jsonschema error path like ['_rules', 0, 'operator'] to "/_rules/0/operator"."""
 
@@ -76,8 +112,10 @@ def iter_validation_errors(
 ) -> Iterable[Any]:
     """Yield jsonschema.ValidationError objects for the given instance."""
 
-    loaded_schema = schema or load_rule_schema(schema_path)
-    validator = _build_validator(loaded_schema, schema_fragment=schema_fragment)
+    if schema_fragment is None:
+        validator, _ = _validators_for(schema, schema_path)
+    else:
+        validator = _build_validator(schema or load_rule_schema(schema_path), schema_fragment=schema_fragment)
     yield from validator.iter_errors(instance)
 
 
@@ -90,18 +128,21 @@ def _collect_errors(
     errors: List[ValidationIssue] = []
     seen = set()
 
+    if schema_fragment is None:
+        validator, fast_validator = _validators_for(schema, schema_path)
+        # Cheap accept path: only walk jsonschema errors when the instance is invalid.
+        if accepts(fast_validator, instance):
+            return errors
+    else:
+        validator = _build_validator(schema or load_rule_schema(schema_path), schema_fragment=schema_fragment)
+
     def _walk(error):
         if error.context:
             for sub_error in error.context:
                 yield from _walk(sub_error)
         yield error
 
-    for error in iter_validation_errors(
-        instance,
-        schema=schema,
-        schema_path=schema_path,
-        schema_fragment=schema_fragment,
-    ):
+    for error in validator.iter_errors(instance):
         for nested in _walk(error):
             key = (tuple(nested.absolute_path), nested.message)
             if key in seen:
@@ -131,7 +172,6 @@ def validate_rule_block(
 ) -> ValidationResult:
     """Validate an individual rule object against the rule item schema."""
 
-    loaded_schema = schema or load_rule_schema(schema_path)
     wrapper = {
         "_name": "tmp",
         "_version": "tmp",
@@ -139,7 +179,7 @@ def validate_rule_block(
         "_scope": [],
         "_rules": [rule_data],
     }
-    errors = _collect_errors(wrapper, schema=loaded_schema, schema_path=schema_path)
+    errors = _collect_errors(wrapper, schema=schema, schema_path=schema_path)
 
     def _strip_wrapper(issue: ValidationIssue) -> ValidationIssue:
         prefix = "/_rules/0"
@@ -1,5 +1,17 @@
-import json
 import os
+from functools import lru_cache
+
+from src.utils import parse_json_bytes
+
+
+@lru_cache(maxsize=8)
+def _validated_source(path: str, mtime_ns: int, size: int) -> bytes:
+    """Raw bytes of a rules file that passed validation; re-read only when the file changes."""
+    with open(path, "rb") as f:
+        source = f.read()
+    RuleLoader(path)._validate_document(parse_json_bytes(source))
+    return source
+
 
 class RuleLoader:
     """
@@ -44,23 +56,26 @@ class RuleLoader:
         ]:
             raise ValueError(f"Unsupported operator {cond['operator']} in rule {category}")
 
-    def load(self) -> list:
-        """Load rules from JSON file and validate schema."""
-        if not os.path.exists(self.path):
-            raise FileNotFoundError(f"Rules file not found: {self.path}")
-
-        with open(self.path, "r") as f:
-            data = json.load(f)
-
+    def _validate_document(self, data: dict):
+        """Validate the top-level ruleset and every rule in it."""
         if "_rules" not in data or not isinstance(data["_rules"], list):
             raise ValueError("Invalid ruleset: missing '_rules' array")
 
-        self.rules = data["_rules"]
-        
-        # Validate each rule
-        for rule in self.rules:
+        for rule in data["_rules"]:
             self._validate_rule(rule)
-            
+
+    def load(self) -> list:
+        """Load rules from JSON file and validate schema.
+
+        Validation runs once per version of the file; later loads only
+        re-parse the cached bytes, so each call still returns fresh rule dicts.
+        """
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"Rules file not found: {self.path}")
+
+        st = os.stat(self.path)
+        source = _validated_source(os.path.abspath(self.path), st.st_mtime_ns, st.st_size)
+        self.rules = parse_json_bytes(source)["_rules"]
         return self.rules
 
     def get_rules(self) -> list:
@@ -6,15 +6,16 @@ This schema is consumed by the exporter to generate headers, apply styles,
 and insert formulas dynamically.
 """
 
-from dataclasses import dataclass
-from typing import Optional, Dict, List
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ColumnSchema:
     letter: str
     name: str
     explanation: str
-    data_format: Dict
+    data_format: Mapping = field(hash=False)  # shared style mappings are unhashable
     formula_template: Optional[str] = None  # For TOTAL column
     width: Optional[float] = None  # Column width in Excel units
 
@@ -22,38 +23,44 @@ class ColumnSchema:
 # Shared Styles
 # --------------------------
 
-HEADER_STYLE = {
-    "number": {"category": "Text"},
-    "font": {"family": "Calibri (Body)", "style": "Bold", "size": 12, "color": "#000000"},
-    "text_alignment": {"horizontal": "Center", "vertical": "Bottom"},
+# Fragments shared by every style (one object each, not one copy per style)
+_CENTER_BOTTOM = MappingProxyType({"horizontal": "Center", "vertical": "Bottom"})
+_BODY_FONT = MappingProxyType({"family": "Calibri (Body)", "style": "Bold", "size": 11, "color": "#000000"})
+_TEXT_NUMBER = MappingProxyType({"category": "Text"})
+
+# Styles are shared by many columns, so they are exposed read-only
+HEADER_STYLE = MappingProxyType({
+    "number": _TEXT_NUMBER,
+    "font": MappingProxyType({"family": "Calibri (Body)", "style": "Bold", "size": 12, "color": "#000000"}),
+    "text_alignment": _CENTER_BOTTOM,
     "text_control": "Wrap text",
     "border": "Top and Thick Bottom Border",
     "fill_color": "#9BC2E6",
-}
+})
 
-EXPENSE_STYLE = {
-    "number": {"category": "Currency", "decimal_places": 2, "symbol": "$"},
-    "font": {"family": "Calibri (Body)", "style": "Bold", "size": 11, "color": "#000000"},
-    "text_alignment": {"horizontal": "Center", "vertical": "Bottom"},
+EXPENSE_STYLE = MappingProxyType({
+    "number": MappingProxyType({"category": "Currency", "decimal_places": 2, "symbol": "$"}),
+    "font": _BODY_FONT,
+    "text_alignment": _CENTER_BOTTOM,
     "border": "Outside Borders",
     "fill_color": "No Color",
-}
+})
 
-TEXT_STYLE = {
-    "number": {"category": "Text"},
-    "font": {"family": "Calibri (Body)", "style": "Bold", "size": 11, "color": "#000000"},
-    "text_alignment": {"horizontal": "Center", "vertical": "Bottom"},
+TEXT_STYLE = MappingProxyType({
+    "number": _TEXT_NUMBER,
+    "font": _BODY_FONT,
+    "text_alignment": _CENTER_BOTTOM,
     "border": "Outside Borders",
     "fill_color": "No Color",
-}
+})
 
-DATE_STYLE = {
-    "number": {"category": "Date", "type": "March 14, 2012"},
-    "font": {"family": "Calibri (Body)", "style": "Bold", "size": 11, "color": "#000000"},
-    "text_alignment": {"horizontal": "Center", "vertical": "Bottom"},
+DATE_STYLE = MappingProxyType({
+    "number": MappingProxyType({"category": "Date", "type": "March 14, 2012"}),
+    "font": _BODY_FONT,
+    "text_alignment": _CENTER_BOTTOM,
     "border": "Outside Borders",
     "fill_color": "No Color",
-}
+})
 
 # --------------------------
 # Schema Definition
@@ -97,20 +104,24 @@ COLUMNS: List[ColumnSchema] = [
     ColumnSchema("AB", "Notes", "Manual notes or unclassified transactions", TEXT_STYLE, width=60.0),
 ]
 
+# Lookup indexes, built once from COLUMNS
+_BY_NAME: Dict[str, ColumnSchema] = {col.name: col for col in COLUMNS}
+_BY_LETTER: Dict[str, ColumnSchema] = {col.letter: col for col in COLUMNS}
+
 def get_schema() -> List[ColumnSchema]:
     """Return the full spreadsheet schema."""
     return COLUMNS
 
 def get_column_by_name(name: str) -> ColumnSchema:
     """Lookup a column by its name."""
-    for col in COLUMNS:
-        if col.name == name:
-            return col
-    raise KeyError(f"Column not found: {name}")
+    try:
+        return _BY_NAME[name]
+    except KeyError:
+        raise KeyError(f"Column not found: {name}") from None
 
 def get_column_by_letter(letter: str) -> ColumnSchema:
     """Lookup a column by its Excel letter."""
-    for col in COLUMNS:
-        if col.letter == letter:
-            return col
-    raise KeyError(f"Column not found: {letter}")
+    try:
+        return _BY_LETTER[letter]
+    except KeyError:
+        raise KeyError(f"Column not found: {letter}") from None
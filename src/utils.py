@@ -1,12 +1,23 @@
 import os
 import sys
+import copy
+import stat
 import json
 import time
 import logging
-import jsonschema
 from pathlib import Path
-from typing import Any, Dict, Callable
-from functools import wraps
+from typing import Any, BinaryIO, Dict, Callable, Union
+from functools import lru_cache, wraps
+
+try:
+    import fastjsonschema
+except ImportError:  # optional: profiles are then validated by jsonschema alone
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json module
+    orjson = None
 
 def _auto_detect_debug() -> bool:
     """Auto-detect debug mode via environment or attached debugger."""
@@ -14,10 +25,15 @@ def _auto_detect_debug() -> bool:
         return True
     return sys.gettrace() is not None
 
+def _perf_monitoring_from_env() -> bool:
+    """PERF timing is on unless BOOKKEEPING_PERF_MONITORING=0 is set."""
+    return os.getenv("BOOKKEEPING_PERF_MONITORING", "1") != "0"
+
 # Global flags
 use_logging = False  # toggled by CLI
 debug_mode = _auto_detect_debug()
-perf_monitoring = True  # toggled as needed
+# Read at import, before any module applies @time_it, so disabling it leaves functions unwrapped
+perf_monitoring = _perf_monitoring_from_env()
 
 
 def notify(message: str, level: str = "info"):
@@ -27,37 +43,66 @@ def notify(message: str, level: str = "info"):
     - If logging is enabled, uses Python's logging module.
     """
     if use_logging:
-        log_fn = getattr(logging, level, logging.info)
-        log_fn(message)
+        _log_fn(level)(message)
     else:
         try:
             print(message)
         except UnicodeEncodeError:
-            # Fallback: write bytes to stdout.buffer encoded as utf-8
-            try:
-                # ensure a newline too
-                sys.stdout.buffer.write((message + "\n").encode("utf-8"))
-                sys.stdout.buffer.flush()
-            except Exception:
-                # Last-resort fallback: print ASCII with replacement to avoid raising
-                print(message.encode("ascii", errors="replace").decode("ascii"))
+            _print_unencodable(message)
+
+
+@lru_cache(maxsize=None)
+def _log_fn(level: str) -> Callable[[str], None]:
+    return getattr(logging, level, logging.info)
+
+
+def _print_unencodable(message: str) -> None:
+    """
+    Slow path for a console whose encoding can't represent the message (e.g. cp1252).
+    Where supported, stdout keeps its encoding but switches to errors="replace" once,
+    so later calls print directly; switching the encoding itself would garble the
+    console's own characters (é, £, ...) as mojibake.
+    """
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if reconfigure is not None:
+        try:
+            reconfigure(errors="replace")
+            print(message)
+            return
+        except Exception:
+            pass
+    try:
+        # Fallback: write bytes to stdout.buffer encoded as utf-8, with a newline
+        sys.stdout.buffer.write((message + "\n").encode("utf-8"))
+        sys.stdout.buffer.flush()
+    except Exception:
+        # Last-resort fallback: print ASCII with replacement to avoid raising
+        print(message.encode("ascii", errors="replace").decode("ascii"))
 
 
 def time_it(fn: Callable) -> Callable:
     """
     Decorator to time function execution and log duration.
     Only outputs if perf_monitoring is enabled.
+
+    If perf_monitoring is already off when a function is decorated (e.g. the
+    process started with BOOKKEEPING_PERF_MONITORING=0), the function is returned
+    unwrapped and pays no per-call cost. Otherwise the flag is still honoured per call.
     """
+    if not perf_monitoring:
+        return fn
+
+    perf_counter = time.perf_counter
+
     @wraps(fn)
     def wrapper(*args, **kwargs):
         # If monitoring is OFF, just call the function
         if not perf_monitoring:
             return fn(*args, **kwargs)
         
-        start_time = time.perf_counter()
+        start_time = perf_counter()
         result = fn(*args, **kwargs)
-        end_time = time.perf_counter()
-        duration = end_time - start_time
+        duration = perf_counter() - start_time
         
         notify(f"PERF: Function '{fn.__name__}' took {duration:.6f}s", level="info")
         return result
@@ -76,14 +121,23 @@ def setup_paths(year: int, base_dir: Path = Path("data")) -> tuple[Path, Path, l
         (input_dir, output_dir, input_files)
     """
     input_dir = base_dir / str(year)
-    if not input_dir.exists() or not input_dir.is_dir():
+    # One stat call answers both "exists" and "is a directory".
+    try:
+        is_dir = stat.S_ISDIR(os.stat(input_dir).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        is_dir = False
+    if not is_dir:
         raise FileNotFoundError(f"Input directory not found: {input_dir}")
 
     output_dir = Path("output") / str(year)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Find CSV files inside the year's input directory (top-level only)
-    files = [p for p in input_dir.glob("*.csv") if p.is_file()]
+    # Find CSV files inside the year's input directory (top-level only).
+    # Extensions compare case-insensitively, as glob does on Windows (e.g. STATEMENT.CSV).
+    files = [
+        Path(entry.path) for entry in os.scandir(input_dir)
+        if entry.name.lower().endswith(".csv") and entry.is_file()
+    ]
     if not files:
         # If no CSVs found in the year folder, raise FileNotFoundError 
         raise FileNotFoundError(f"No CSV files found in input directory: {input_dir}")
@@ -91,17 +145,107 @@ def setup_paths(year: int, base_dir: Path = Path("data")) -> tuple[Path, Path, l
     return input_dir, output_dir, files
 
 
-def load_rules(rules_path: Path) -> Dict[str, Any]:
-    """Load and validate the JSON allocation rules file."""
-    if not Path(rules_path).is_file():
-        raise FileNotFoundError(f"Rules file not found: {rules_path}")
-    with open(rules_path, "r") as f:
-        rules = json.load(f)
+def read_json(path: Path) -> Any:
+    """
+    Parse a JSON file, using orjson on the raw bytes when it is installed.
+    Documents orjson rejects (e.g. NaN literals) are re-parsed with the stdlib json module.
+    """
+    return parse_json_bytes(Path(path).read_bytes())
+
+
+def parse_json_bytes(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available, falling back to the stdlib json module."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_rules(rules_path: Union[Path, BinaryIO]) -> Dict[str, Any]:
+    """Load and validate the JSON allocation rules file (a path, or an already open binary file)."""
+    if hasattr(rules_path, "read"):
+        rules = parse_json_bytes(rules_path.read())
+    else:
+        if not Path(rules_path).is_file():
+            raise FileNotFoundError(f"Rules file not found: {rules_path}")
+        rules = read_json(rules_path)
     if not isinstance(rules, dict) or "_rules" not in rules:
         raise TypeError(f"Rules file {rules_path} does not contain a valid JSON object or missing '_rules' key.")
     return rules
 
 
+@lru_cache(maxsize=8)
+def _get_profile_validators(schema_path: Path, mtime_ns: int):
+    """
+    Build (and memoize) the validators for a profile schema file.
+    The file's mtime is part of the cache key so edits to the schema are picked up.
+
+    Returns (jsonschema validator, fastjsonschema callable or None).
+    """
+    # Imported here: jsonschema dominates this module's import time and only profile loading needs it.
+    import jsonschema
+    from src._generated import get_pregenerated_validator, schema_digest
+
+    schema = read_json(schema_path)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+
+    fast_validator = get_pregenerated_validator(schema_digest(schema))
+    if fast_validator is None and fastjsonschema is not None:
+        try:
+            # use_default=False: validation must not write schema defaults into the profile.
+            fast_validator = fastjsonschema.compile(schema, use_default=False)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            fast_validator = None
+    return validator_cls(schema), fast_validator
+
+
+def _validate_profile(profile: Dict[str, Any], schema_path: Path) -> None:
+    """
+    Validate a profile like jsonschema.validate, reusing the cached validators.
+    Valid profiles are accepted by the compiled fastjsonschema check alone; invalid
+    ones are re-checked with jsonschema so callers still get jsonschema.ValidationError.
+    """
+    validator, fast_validator = _get_profile_validators(Path(schema_path).resolve(), schema_path.stat().st_mtime_ns)
+    if fast_validator is not None:
+        try:
+            fast_validator(profile)
+            return
+        except fastjsonschema.JsonSchemaException:
+            pass
+    from jsonschema.exceptions import best_match
+
+    error = best_match(validator.iter_errors(profile))
+    if error is not None:
+        raise error
+
+
+@lru_cache(maxsize=32)
+def _parse_valid_profile(profile_path: Path, profile_stamp: tuple, schema_path: Path, schema_mtime_ns: int) -> Dict[str, Any]:
+    """Parse and validate one version of a profile file; the stamps key out stale entries."""
+    profile = read_json(profile_path)
+    _validate_profile(profile, schema_path)
+    return profile
+
+
+def _load_valid_profile(profile_path: Path, schema_path: Path) -> Dict[str, Any]:
+    """
+    Return a validated profile, re-reading it only when it or its schema changed on disk.
+    Callers get their own copy, so mutating it cannot leak into later loads.
+    """
+    st = os.stat(profile_path)
+    # Absolute paths in the key: a relative one would match a different file after a chdir.
+    profile = _parse_valid_profile(
+        Path(profile_path).resolve(),
+        (st.st_mtime_ns, st.st_size),
+        Path(schema_path).resolve(),
+        schema_path.stat().st_mtime_ns,
+    )
+    return copy.deepcopy(profile)
+
+
 def load_bank_profile(bank: str, profiles_dir: Path = Path("config/bank_profiles"), schema_filename: str = "bank_profile_schema.json") -> Dict[str, Any]:
     """
     Load and validate a per-bank profile config.
@@ -131,35 +275,37 @@ def load_bank_profile(bank: str, profiles_dir: Path = Path("config/bank_profiles
         raise FileNotFoundError(f"No profile schema found at: {schema_path}")
 
     # --- Try exact match first ---
+    # Open directly rather than exists()-then-open: one filesystem round trip on the common path.
     profile_path = profiles_dir / f"{bank}.json"
-    if profile_path.exists():
-        with open(profile_path, "r") as f:
-            profile = json.load(f)
-        with open(schema_path, "r") as f:
-            schema = json.load(f)
-        jsonschema.validate(profile, schema)
-        return profile
+    try:
+        return _load_valid_profile(profile_path, schema_path)
+    except FileNotFoundError:
+        pass
 
     # --- Fuzzy match: search for files containing the bank id (case-insensitive) ---
+    # One directory pass collects both the candidates and the names for the error message.
+    # File names compare case-insensitively, as glob does on Windows (e.g. TD_VISA.JSON).
     bank_lower = bank.lower()
-    matching_files = [
-        f for f in profiles_dir.glob("*.json")
-        if f.name != schema_filename and bank_lower in f.stem.lower()
-    ]
+    schema_lower = schema_filename.lower()
+    matching_files = []
+    available = []
+    for entry in os.scandir(profiles_dir):
+        name = entry.name
+        name_lower = name.lower()
+        if not name_lower.endswith(".json") or name_lower == schema_lower or not entry.is_file():
+            continue
+        stem = name[:-5]
+        available.append(stem)
+        if bank_lower in stem.lower():
+            matching_files.append(Path(entry.path))
 
     if matching_files:
         # Use the first match (or pick the best one if multiple)
         profile_path = matching_files[0]
         notify(f"No exact profile found for bank '{bank}'. Using closest match: '{profile_path.stem}'.", level="info")
-        with open(profile_path, "r") as f:
-            profile = json.load(f)
-        with open(schema_path, "r") as f:
-            schema = json.load(f)
-        jsonschema.validate(profile, schema)
-        return profile
+        return _load_valid_profile(profile_path, schema_path)
 
     # --- No match found ---
-    available = [f.stem for f in profiles_dir.glob("*.json") if f.name != schema_filename]
     raise FileNotFoundError(f"No profile found for bank '{bank}'. Available profiles: {', '.join(available)}")
 
 
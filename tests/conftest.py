@@ -0,0 +1,49 @@
+"""
+Shared fixtures for the top-level test suite.
+
+Bank profiles are parsed once per session; tests only read them.
+End-to-end tests marked ``slow`` are skipped unless ``--runslow`` is given.
+"""
+
+import json
+import pathlib
+
+import pytest
+
+PROFILES_DIR = pathlib.Path("./config/bank_profiles")
+
+
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", default=False, help="also run tests marked slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+def _read_profile(name: str) -> dict:
+    with open(PROFILES_DIR / name, "r") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def triangle_profile():
+    """Load Triangle MasterCard profile config from JSON."""
+    return _read_profile("triangle.json")
+
+
+@pytest.fixture(scope="session")
+def cibc_profile():
+    """Load CIBC MasterCard profile config from JSON."""
+    return _read_profile("cibc.json")
+
+
+@pytest.fixture(scope="session")
+def td_visa_profile():
+    """Load TD Visa profile config from JSON."""
+    return _read_profile("td_visa.json")
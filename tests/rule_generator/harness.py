@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-import json
+import atexit
+import copy
+import itertools
+import shutil
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
@@ -14,6 +18,7 @@ from src.rule_generator import (
     validate_rule_block,
     validate_rules_document as _validate_rules_document,
 )
+from src.utils import read_json
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 TRANSACTIONS_PATH = FIXTURES_DIR / "transactions.json"
@@ -22,20 +27,27 @@ INVALID_RULES_PATH = FIXTURES_DIR / "rules_invalid.json"
 EDGE_RULES_PATH = FIXTURES_DIR / "rules_edge_cases.json"
 
 
+@lru_cache(maxsize=None)
+def _read_fixture(path: Path) -> Any:
+    return read_json(path)
+
+
+# Each loader parses its fixture once per session and hands out a deep copy,
+# so a test mutating the result cannot leak into another test.
 def load_canonical_transactions() -> List[Dict[str, Any]]:
-    return json.loads(TRANSACTIONS_PATH.read_text(encoding="utf-8"))
+    return copy.deepcopy(_read_fixture(TRANSACTIONS_PATH))
 
 
 def load_valid_rules() -> List[Dict[str, Any]]:
-    return json.loads(VALID_RULES_PATH.read_text(encoding="utf-8"))
+    return copy.deepcopy(_read_fixture(VALID_RULES_PATH))
 
 
 def load_invalid_rules() -> List[Dict[str, Any]]:
-    return json.loads(INVALID_RULES_PATH.read_text(encoding="utf-8"))
+    return copy.deepcopy(_read_fixture(INVALID_RULES_PATH))
 
 
 def load_edge_case_rules() -> List[Dict[str, Any]]:
-    return json.loads(EDGE_RULES_PATH.read_text(encoding="utf-8"))
+    return copy.deepcopy(_read_fixture(EDGE_RULES_PATH))
 
 
 def run_evaluation(
@@ -55,11 +67,27 @@ def validate_rules_document(doc: Dict[str, Any]):
     return _validate_rules_document(doc)
 
 
+_ROUND_TRIP_DIR: Optional[Path] = None
+_round_trip_ids = itertools.count()
+
+
+def _round_trip_dir() -> Path:
+    """One scratch directory per session for round trips, removed at interpreter exit."""
+
+    global _ROUND_TRIP_DIR
+    if _ROUND_TRIP_DIR is None:
+        _ROUND_TRIP_DIR = Path(tempfile.mkdtemp(prefix="rulegen-roundtrip-"))
+        atexit.register(shutil.rmtree, _ROUND_TRIP_DIR, ignore_errors=True)
+    return _ROUND_TRIP_DIR
+
+
 def round_trip_rules(rules_dict: Dict[str, Any]) -> Dict[str, Any]:
     """Save then load rules via the adapter to ensure structure is preserved."""
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        rules_path = Path(tmpdir) / "rules.json"
-        save_rules(rules_dict, path=rules_path)
-        reloaded = load_rules(rules_path)
-    return reloaded
+    rules_path = _round_trip_dir() / f"rules_{next(_round_trip_ids)}.json"
+    # Scratch directory: durability is irrelevant, skip the fsync.
+    save_rules(rules_dict, path=rules_path, fsync=False)
+    try:
+        return load_rules(rules_path)
+    finally:
+        rules_path.unlink()
@@ -1,4 +1,6 @@
-from src.rule_generator.rule_evaluator import evaluate_rule
+import pytest
+
+from src.rule_generator.rule_evaluator import compile_rules, evaluate_rule, prepare_transactions
 
 
 CANONICAL_BASE = {
@@ -143,3 +145,193 @@ def test_false_positive_detection():
     assert report["matches"] == transactions
     assert report["false_positives"] == [transactions[1]]
     assert report["false_negatives"] == []
+
+
+def test_string_operators_ignore_case_of_expected_value():
+    rule = {
+        "logic": "MUST_MATCH_ANY",
+        "rules": [
+            {"field": "Description", "operator": "STARTS_WITH", "value": "Fido"},
+            {"field": "Description", "operator": "EQUALS", "value": "monthly account fee"},
+        ],
+    }
+    transactions = [
+        _tx(Description="FIDO MOBILE"),
+        _tx(Description="MONTHLY ACCOUNT FEE"),
+        _tx(Description="BELL CANADA"),
+    ]
+
+    report = evaluate_rule(rule, transactions)
+
+    assert report["matches"] == transactions[:2]
+
+
+def test_generator_input_matches_sequence_input():
+    rule = {
+        "logic": "MUST_MATCH_ALL",
+        "rules": [
+            {"field": "Description", "operator": "CONTAINS", "value": "coffee"},
+            {
+                "group_logic": "MUST_MATCH_ANY",
+                "rules": [
+                    {"field": "Debit", "operator": "LESS_THAN_OR_EQUAL_TO", "value": 5},
+                    {"field": "Debit", "operator": "BETWEEN", "value": [10, 12]},
+                ],
+            },
+        ],
+    }
+    transactions = [
+        _tx(Description="COFFEE SHOP", Debit=4.0),
+        _tx(Description="COFFEE BEANS", Debit=15.0),
+        _tx(Description="TEA HOUSE", Debit=3.0),
+        _tx(Description="coffee club", Debit=11.0),
+    ]
+
+    from_list = evaluate_rule(rule, transactions, expected_matches=[0, 1])
+    from_generator = evaluate_rule(rule, (tx for tx in transactions), expected_matches=[0, 1])
+
+    assert from_list["matches"] == [transactions[0], transactions[3]]
+    assert from_generator["matches"] == from_list["matches"]
+    assert from_list["false_negatives"] == [transactions[1]]
+    assert from_generator["false_negatives"] == from_list["false_negatives"]
+
+
+def test_malformed_rule_items_are_rejected_before_evaluation():
+    rule = {"logic": "MUST_MATCH_ANY", "rules": ["Description CONTAINS COFFEE"]}
+
+    with pytest.raises(ValueError):
+        evaluate_rule(rule, [_tx(Description="COFFEE SHOP")])
+
+
+def test_prepared_transactions_share_columns_across_rules():
+    transactions = prepare_transactions(
+        [
+            _tx(Description="FIDO MOBILE", Debit=40.0),
+            _tx(Description="HOME DEPOT", Debit=120.0),
+        ]
+    )
+    phone_rule = {
+        "logic": "MUST_MATCH_ANY",
+        "rules": [{"field": "Description", "operator": "STARTS_WITH", "value": "fido"}],
+    }
+    hardware_rule = {
+        "logic": "MUST_MATCH_ALL",
+        "rules": [
+            {"field": "Description", "operator": "CONTAINS", "value": "depot"},
+            {"field": "Debit", "operator": "BETWEEN", "value": [100, 200]},
+        ],
+    }
+
+    assert evaluate_rule(phone_rule, transactions)["matches"] == [transactions[0]]
+    description_column = transactions.columns.get("lower", "Description")
+    assert evaluate_rule(hardware_rule, transactions, expected_matches=[1])["matches"] == [transactions[1]]
+    assert transactions.columns.get("lower", "Description") is description_column
+
+
+def test_many_contains_needles_under_any_match_like_individual_conditions():
+    rule = {
+        "logic": "MUST_MATCH_ANY",
+        "rules": [
+            {"field": "Description", "operator": "CONTAINS", "value": "Fido"},
+            {"field": "Description", "operator": "CONTAINS", "value": "BELL (CA)"},
+            {"field": "Description", "operator": "CONTAINS", "value": "rogers"},
+            {"field": "Debit", "operator": "LESS_THAN_OR_EQUAL_TO", "value": 1},
+        ],
+    }
+    transactions = [
+        _tx(Description="FIDO MOBILE", Debit=40.0),
+        _tx(Description="BELL (CA) INTERNET", Debit=80.0),
+        _tx(Description="BELL CANADA", Debit=80.0),
+        _tx(Description="ROGERS WIRELESS", Debit=55.0),
+        _tx(Description="INTEREST", Debit=0.5),
+    ]
+    expected = [transactions[0], transactions[1], transactions[3], transactions[4]]
+
+    assert evaluate_rule(rule, transactions)["matches"] == expected
+    assert evaluate_rule(rule, iter(transactions))["matches"] == expected
+
+
+def test_regex_operator_matches_like_legacy_engine():
+    rule = {
+        "logic": "MUST_MATCH_ANY",
+        "rules": [{"field": "Description", "operator": "REGEX", "value": r"^E-TRANSFER \d+"}],
+    }
+    transactions = [
+        _tx(Description="E-TRANSFER 1234 JOHN"),
+        _tx(Description="e-transfer 99 lowercase"),
+        _tx(Description="SEND E-TRANSFER 55"),
+    ]
+
+    assert evaluate_rule(rule, transactions)["matches"] == [transactions[0]]
+    assert evaluate_rule(rule, iter(transactions))["matches"] == [transactions[0]]
+
+    broken = {"logic": "MUST_MATCH_ANY", "rules": [{"field": "Description", "operator": "REGEX", "value": "("}]}
+    assert evaluate_rule(broken, transactions)["matches"] == []
+
+
+def test_prepared_transactions_reuse_condition_hits_across_rules():
+    transactions = prepare_transactions(
+        [
+            _tx(Description="ESSO CIRCLE K #123", Debit=60.0),
+            _tx(Description="7-ELEVEN STORE", Debit=8.0),
+        ]
+    )
+    fuel = {
+        "logic": "MUST_MATCH_ANY",
+        "rules": [{"field": "Description", "operator": "CONTAINS", "value": "esso circle k"}],
+    }
+    small_fuel = {
+        "logic": "MUST_MATCH_ALL",
+        "rules": [
+            {"field": "Description", "operator": "CONTAINS", "value": "ESSO CIRCLE K"},
+            {"field": "Debit", "operator": "LESS_THAN_OR_EQUAL_TO", "value": 50},
+        ],
+    }
+
+    assert evaluate_rule(fuel, transactions)["matches"] == [transactions[0]]
+    assert evaluate_rule(small_fuel, transactions)["matches"] == []
+    assert len(transactions.columns._hits) == 2
+
+
+def test_compile_rules_builds_one_predicate_per_rule_in_order():
+    document = {
+        "_rules": [
+            {
+                "logic": "MUST_MATCH_ALL",
+                "rules": [
+                    {"field": "Description", "operator": "CONTAINS", "value": "home depot"},
+                    {
+                        "group_logic": "MUST_MATCH_ANY",
+                        "rules": [
+                            {"field": "Debit", "operator": "BETWEEN", "value": [20, 120]},
+                            {"field": "Credit", "operator": "LESS_THAN_OR_EQUAL_TO", "value": 0},
+                        ],
+                    },
+                ],
+            },
+            {"logic": "MUST_MATCH_ANY", "rules": []},
+        ]
+    }
+
+    hardware, empty = compile_rules(document)
+
+    assert hardware(_tx(Description="THE HOME DEPOT #7001", Debit=50.0, Credit=5.0)) is True
+    assert hardware(_tx(Description="THE HOME DEPOT #7001", Debit=500.0, Credit=5.0)) is False
+    assert empty(_tx(Description="THE HOME DEPOT #7001")) is False
+    assert compile_rules(document)[0] is hardware
+
+
+def test_all_logic_runs_numeric_checks_before_substring_scans():
+    rule = {
+        "logic": "MUST_MATCH_ALL",
+        "rules": [
+            {"field": "Description", "operator": "CONTAINS", "value": "esso"},
+            {"field": "Debit", "operator": "BETWEEN", "value": [30, 40]},
+        ],
+    }
+    (predicate,) = compile_rules([rule])
+    source = predicate.__source__
+
+    assert source.index("get('Debit')") < source.index("get('Description')")
+    assert predicate(_tx(Description="ESSO 1234", Debit=35.0)) is True
+    assert predicate(_tx(Description="ESSO 1234", Debit=95.0)) is False
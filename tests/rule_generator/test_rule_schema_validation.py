@@ -1,6 +1,8 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from src.rule_generator.schema import (
     ValidationIssue,
     load_rule_schema,
@@ -15,6 +17,13 @@ def _assert_has_error(errors: list[ValidationIssue], needle: str) -> bool:
     return any(needle in issue["message"] or needle in issue["path"] for issue in errors)
 
 
+@pytest.fixture(scope="module")
+def allocation_rules():
+    """Canonical allocation_rules.json, parsed once for the module (tests copy before mutating)."""
+    assert ALLOCATION_PATH.exists(), f"Missing allocation rules: {ALLOCATION_PATH}"
+    return json.loads(ALLOCATION_PATH.read_text(encoding="utf-8"))
+
+
 def test_load_rule_schema():
     """Schema loads successfully and includes the rule items fragment."""
     schema = load_rule_schema()
@@ -22,11 +31,9 @@ def test_load_rule_schema():
     assert "_rules" in schema["properties"]
 
 
-def test_allocation_rules_conform_to_schema():
+def test_allocation_rules_conform_to_schema(allocation_rules):
     """Validate the canonical allocation_rules.json against the rule schema."""
-    assert ALLOCATION_PATH.exists(), f"Missing allocation rules: {ALLOCATION_PATH}"
-    rules = json.loads(ALLOCATION_PATH.read_text(encoding="utf-8"))
-    result = validate_rules_document(rules)
+    result = validate_rules_document(allocation_rules)
     assert result["valid"], result["errors"]
 
 
@@ -83,4 +90,67 @@ def test_rules_document_missing_name_surfaces_error():
     }
     result = validate_rules_document(document)
     assert result["valid"] is False
-    assert _assert_has_error(result["errors"], "_name")
\ No newline at end of file
+    assert _assert_has_error(result["errors"], "_name")
+
+def test_fast_gate_agrees_with_full_validation(allocation_rules):
+    pytest.importorskip("fastjsonschema")
+    from src.rule_generator._fast_validator import passes_fast_gate
+
+    schema = load_rule_schema()
+    assert passes_fast_gate(allocation_rules, schema) is True
+
+    broken = dict(allocation_rules)
+    del broken["_name"]
+    assert passes_fast_gate(broken, schema) is False
+    assert validate_rules_document(broken)["valid"] is False
+
+
+def test_tuple_containers_are_not_accepted_by_fast_gate(allocation_rules):
+    """fastjsonschema treats tuples as arrays; jsonschema (the baseline) rejects them."""
+    from src.rule_generator._fast_validator import passes_fast_gate
+
+    rule = {
+        "category_name": "Office Expenses - Retail/Hardware",
+        "transaction_type": "EXPENSE",
+        "logic": "MUST_MATCH_ALL",
+        "rules": ({"field": "Description", "operator": "CONTAINS", "value": "HOME DEPOT"},),
+    }
+    assert validate_rule_block(rule)["valid"] is False
+
+    scoped = dict(allocation_rules, _scope=("a",))
+    assert passes_fast_gate(scoped, load_rule_schema()) is False
+    assert validate_rules_document(scoped)["valid"] is False
+    assert validate_rules_document(allocation_rules)["valid"] is True
+
+
+def test_validation_does_not_fill_schema_defaults():
+    pytest.importorskip("fastjsonschema")
+    schema = {
+        "type": "object",
+        "properties": {"_rules": {"type": "array"}, "_version": {"type": "string", "default": "1.0"}},
+    }
+    document = {"_rules": []}
+
+    assert validate_rules_document(document, schema=schema)["valid"] is True
+    assert document == {"_rules": []}
+
+
+def test_schema_file_edits_are_picked_up(tmp_path):
+    import os
+
+    schema_path = tmp_path / "rule_schema.json"
+    schema_path.write_text(json.dumps({"type": "object"}), encoding="utf-8")
+    document = {"_name": "x"}
+    assert validate_rules_document(document, schema_path=schema_path)["valid"] is True
+
+    schema_path.write_text(json.dumps({"type": "object", "required": ["_rules"]}), encoding="utf-8")
+    stat = schema_path.stat()
+    os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    result = validate_rules_document(document, schema_path=schema_path)
+    assert result["valid"] is False
+    assert _assert_has_error(result["errors"], "_rules")
+
+
+def test_missing_schema_file_is_reported(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Rule schema not found"):
+        validate_rules_document({}, schema_path=tmp_path / "missing.json")
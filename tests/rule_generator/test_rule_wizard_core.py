@@ -1,4 +1,5 @@
 from src.rule_generator.core import RuleWizard
+from src.rule_generator.rule_evaluator import prepare_transactions
 
 
 BASE_TX = {
@@ -109,3 +110,22 @@ def test_missing_intent_raises():
         assert False, "Expected ValueError"
     except ValueError:
         pass
+
+
+def test_dry_run_reuses_prepared_transactions():
+    seen = []
+
+    def evaluator(rule, transactions, *, expected_matches=None):
+        seen.append(transactions)
+        return {"matches": [], "false_positives": [], "false_negatives": []}
+
+    wizard = RuleWizard(evaluator=evaluator)
+    wizard.set_intent(category_name="Office", transaction_type="EXPENSE", logic="MUST_MATCH_ANY")
+    wizard.add_condition("Description", "CONTAINS", "HOME DEPOT")
+
+    prepared = prepare_transactions([_tx(Description="HOME DEPOT", Debit=20.0)])
+    wizard.finalize_rule(validate=False, dry_run_transactions=prepared)
+    wizard.finalize_rule(validate=False, dry_run_transactions=iter(list(prepared)))
+
+    assert seen[0] is prepared
+    assert seen[1] == list(prepared)
@@ -1,4 +1,5 @@
 import json
+import math
 from pathlib import Path
 from typing import Dict, Any
 
@@ -43,6 +44,29 @@ def test_save_and_load_round_trip_preserves_structure(tmp_path: Path):
     assert loaded == rules
 
 
+def test_round_trip_keeps_non_finite_numbers(tmp_path: Path):
+    rules_path = tmp_path / "rules.json"
+    rules = _sample_rules()
+    rules["_rules"][0]["rules"].append(
+        {"field": "Debit", "operator": "BETWEEN", "value": [float("-inf"), float("nan")]}
+    )
+    rules["_rules"][0]["rules"].append({"field": "Credit", "operator": "LESS_THAN_OR_EQUAL_TO", "value": float("inf")})
+    save_rules(rules, path=rules_path)
+
+    loaded = load_rules(rules_path)
+    low, high = loaded["_rules"][0]["rules"][1]["value"]
+    assert low == float("-inf")
+    assert math.isnan(high)
+    assert loaded["_rules"][0]["rules"][2]["value"] == float("inf")
+
+
+def test_load_rules_reads_nan_literals_written_by_stdlib_json(tmp_path: Path):
+    rules_path = tmp_path / "rules.json"
+    rules_path.write_text(json.dumps({"_rules": [], "threshold": float("nan")}), encoding="utf-8")
+
+    assert math.isnan(load_rules(rules_path)["threshold"])
+
+
 def test_metadata_fields_preserved(tmp_path: Path):
     rules_path = tmp_path / "rules.json"
     rules = _sample_rules(include_metadata=True)
@@ -81,3 +105,17 @@ def test_save_rules_allows_valid_when_validation_requested(tmp_path: Path):
 
     loaded = load_rules(rules_path)
     assert loaded == rules
+
+
+def test_save_rules_without_fsync_skips_disk_sync(tmp_path: Path, monkeypatch):
+    calls = []
+    monkeypatch.setattr("src.rule_generator.rules_io.os.fsync", lambda fd: calls.append(fd))
+    rules_path = tmp_path / "rules.json"
+    rules = _sample_rules()
+
+    save_rules(rules, path=rules_path, fsync=False)
+    assert calls == []
+    assert load_rules(rules_path) == rules
+
+    save_rules(rules, path=rules_path)
+    assert len(calls) == 1
@@ -91,3 +91,122 @@ def test_unclassified_transaction(sample_rules):
     assert result["category"] == "Unclassified"
     assert result["transaction_type"] in ["MANUAL_CR", "MANUAL_DR"]
     assert result["dual_entry"] is None
+
+def test_literal_prefilter_keeps_rule_priority_and_numeric_rules(sample_rules):
+    small_debits = {
+        "category_name": "Small Debit",
+        "transaction_type": "EXPENSE",
+        "logic": "MUST_MATCH_ALL",
+        "rules": [{"field": "Debit", "operator": "LESS_THAN_OR_EQUAL_TO", "value": 10.00}],
+    }
+    classifier = TransactionClassifier(sample_rules + [small_debits])
+
+    assert classifier.classify({"Description": "TIM HORTONS #123", "Debit": 4.50})["category"] == "Business Coffee"
+    assert classifier.classify({"Description": "PARKING", "Debit": 4.50})["category"] == "Small Debit"
+    assert classifier.classify({"Description": None, "Debit": 50.00})["category"] == "Unclassified"
+
+def test_compiled_rules_match_operator_semantics():
+    rules = [
+        {
+            "category_name": "Bad Range",
+            "transaction_type": "EXPENSE",
+            "rules": [{"field": "Debit", "operator": "BETWEEN", "value": ["low", 10]}],
+        },
+        {
+            "category_name": "Phone",
+            "transaction_type": "EXPENSE",
+            "logic": "MUST_MATCH_ANY",
+            "rules": [
+                {"field": "Description", "operator": "REGEX", "value": r"^FIDO\b"},
+                {"field": "Description", "operator": "EQUALS", "value": "bell canada"},
+            ],
+        },
+    ]
+    classifier = TransactionClassifier(rules)
+
+    assert classifier.classify({"Description": "FIDO Mobile", "Debit": 5.0})["category"] == "Phone"
+    assert classifier.classify({"Description": "BELL CANADA", "Debit": 5.0})["category"] == "Phone"
+    assert classifier.classify({"Description": "fido mobile", "Debit": 5.0})["category"] == "Unclassified"
+
+def test_unsupported_operator_still_raises():
+    rules = [{"category_name": "X", "transaction_type": "EXPENSE", "rules": [{"field": "Debit", "operator": "ABOUT", "value": 1}]}]
+    with pytest.raises(ValueError, match="Unsupported operator"):
+        TransactionClassifier(rules).classify({"Description": "ANY", "Debit": 1.0})
+
+def test_classify_batch_matches_single_classification(sample_rules):
+    classifier = TransactionClassifier(sample_rules)
+    txs = [
+        {"Description": "TIM HORTONS #123", "Debit": 4.50, "Credit": ""},
+        {"Description": "ESSO CIRCLE K", "Debit": 50.00, "Credit": ""},
+        {"Description": "TIM HORTONS #123", "Debit": 40.00, "Credit": ""},
+        {"Description": "UNKNOWN MERCHANT", "Debit": "", "Credit": 10.0},
+    ]
+
+    assert classifier.classify_batch(txs) == [classifier.classify(tx) for tx in txs]
+    assert classifier.classify_batch([]) == []
+
+def test_classify_batch_shares_results_between_identical_rows(sample_rules):
+    txs = [
+        {"Description": "TIM HORTONS #123", "Debit": 4.50, "Credit": ""},
+        {"Description": "TIM HORTONS #123", "Debit": 4.50, "Credit": ""},
+        {"Description": "UNKNOWN MERCHANT", "Debit": 4.50, "Credit": ""},
+        {"Description": "UNKNOWN MERCHANT", "Debit": "", "Credit": 4.50},
+    ]
+    results = TransactionClassifier(sample_rules).classify_batch(txs)
+
+    assert results == [TransactionClassifier(sample_rules).classify(tx) for tx in txs]
+    assert results[0] is not results[1]
+    assert [r["transaction_type"] for r in results[2:]] == ["MANUAL_CR", "MANUAL_DR"]
+
+def test_repeated_transactions_reuse_first_match_but_respect_amounts():
+    rules = [
+        {
+            "category_name": "Fuel",
+            "transaction_type": "EXPENSE",
+            "logic": "MUST_MATCH_ALL",
+            "rules": [
+                {"field": "Description", "operator": "CONTAINS", "value": "shell"},
+                {"field": "Debit", "operator": "BETWEEN", "value": [0, 100]},
+            ],
+        },
+        {
+            "category_name": "Shell Other",
+            "transaction_type": "EXPENSE",
+            "rules": [{"field": "Description", "operator": "CONTAINS", "value": "shell"}],
+        },
+    ]
+    classifier = TransactionClassifier(rules)
+
+    for _ in range(2):
+        assert classifier.classify({"Description": "SHELL #12", "Debit": 50.0})["category"] == "Fuel"
+        assert classifier.classify({"Description": "SHELL #12", "Debit": 500.0})["category"] == "Shell Other"
+        assert classifier.classify({"Description": "SHELL #12", "Debit": "50"})["category"] == "Fuel"
+    assert classifier.classify({"Description": "ESSO", "Debit": 5.0})["transaction_type"] == "MANUAL_CR"
+    assert classifier.classify({"Description": "ESSO", "Debit": ""})["transaction_type"] == "MANUAL_DR"
+    assert classifier.classify({"Description": ["SHELL"], "Debit": 5.0})["category"] == "Unclassified"
+
+def test_memo_does_not_merge_equal_values_that_print_differently():
+    from decimal import Decimal
+
+    rules = [
+        {
+            "category_name": "Zero",
+            "transaction_type": "EXPENSE",
+            "rules": [{"field": "Debit", "operator": "EQUALS", "value": "0.0"}],
+        },
+        {
+            "category_name": "Exact Decimal",
+            "transaction_type": "EXPENSE",
+            "rules": [{"field": "Debit", "operator": "EQUALS", "value": "1.00"}],
+        },
+    ]
+    debits = [0.0, -0.0, Decimal("1.0"), Decimal("1.00")]
+    expected = [TransactionClassifier(rules).classify({"Debit": d})["category"] for d in debits]
+    assert expected == ["Zero", "Unclassified", "Unclassified", "Exact Decimal"]
+
+    for order in (debits, debits[::-1]):
+        classifier = TransactionClassifier(rules)
+        got = {repr(d): classifier.classify({"Debit": d})["category"] for d in order}
+        assert [got[repr(d)] for d in debits] == expected
+        batch = TransactionClassifier(rules).classify_batch([{"Debit": d} for d in order])
+        assert [r["category"] for r in batch] == [got[repr(d)] for d in order]
@@ -4,16 +4,16 @@ import json
 from src.rules import RuleLoader
 from src.classify import TransactionClassifier
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def ruleset():
     """Load the real allocation_rules.json file."""
     path = os.path.join("config", "allocation_rules.json")
     loader = RuleLoader(path)
     return loader.load()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def classifier(ruleset):
-    """Instantiate classifier with real ruleset."""
+    """Instantiate classifier with real ruleset (shared; classify() never mutates its input or rules)."""
     return TransactionClassifier(ruleset)
 
 # --------------------------
@@ -73,3 +73,27 @@ def test_unclassified_fallback(classifier):
     result = classifier.classify(tx)
     assert result["category"] == "Unclassified"
     assert result["dual_entry"] is None
+
+def test_rule_loader_returns_fresh_rules_and_picks_up_edits(tmp_path):
+    rule = {
+        "category_name": "Coffee",
+        "transaction_type": "IGNORE_TRANSACTION",
+        "logic": "MUST_MATCH_ANY",
+        "rules": [{"field": "Description", "operator": "CONTAINS", "value": "COFFEE"}],
+    }
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({"_rules": [rule]}))
+
+    first = RuleLoader(str(path)).load()
+    first[0]["category_name"] = "mutated"
+    assert RuleLoader(str(path)).load()[0]["category_name"] == "Coffee"
+
+    path.write_text(json.dumps({"_rules": [rule, dict(rule, category_name="Tea")]}))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert [r["category_name"] for r in RuleLoader(str(path)).load()] == ["Coffee", "Tea"]
+
+    path.write_text(json.dumps({"_rules": [{"category_name": "Broken"}]}))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    with pytest.raises(ValueError):
+        RuleLoader(str(path)).load()
@@ -1,4 +1,5 @@
 import io
+import os
 import sys
 import json
 import pytest
@@ -6,11 +7,19 @@ from typing import BinaryIO
 from pathlib import Path
 from src.utils import load_rules, load_bank_profile, setup_paths, notify
 
-def test_load_rules(tmp_path):
+def test_load_rules():
+    rules = {"_rules": []}
+    assert load_rules(io.BytesIO(json.dumps(rules).encode())) == rules
+    with pytest.raises(TypeError):
+        load_rules(io.BytesIO(b"[]"))
+
+def test_load_rules_from_path(tmp_path):
     rules = {"_rules": []}
     f = tmp_path / "rules.json"
     f.write_text(json.dumps(rules))
     assert load_rules(f) == rules
+    with pytest.raises(FileNotFoundError):
+        load_rules(tmp_path / "missing.json")
 
 def test_load_bank_profile(tmp_path):
     profiles_dir = tmp_path / "bank_profiles"
@@ -22,17 +31,148 @@ def test_load_bank_profile(tmp_path):
     loaded = load_bank_profile("sample", profiles_dir=profiles_dir)
     assert loaded["bank_name"] == "sample"
 
-def test_setup_paths_success(tmp_path):
-    year_dir = tmp_path / "2025"
-    year_dir.mkdir()
+def test_load_bank_profile_returns_file_contents_unchanged(tmp_path):
+    profiles_dir = tmp_path / "bank_profiles"
+    profiles_dir.mkdir()
+    profile = {"bank_name": "sample", "sections": [{"section_name": "Purchases"}]}
+    (profiles_dir / "sample.json").write_text(json.dumps(profile))
+    section_schema = {"type": "object", "properties": {"skip_footer_rows": {"type": "boolean", "default": False}}}
+    schema = {
+        "type": "object",
+        "properties": {"sections": {"type": "array", "items": section_schema}},
+    }
+    (profiles_dir / "bank_profile_schema.json").write_text(json.dumps(schema))
+
+    assert load_bank_profile("sample", profiles_dir=profiles_dir) == profile
+
+def test_pregenerated_profile_validator_does_not_fill_defaults(triangle_profile):
+    import copy
+    from src._generated import get_pregenerated_validator, schema_digest
+
+    schema = json.loads(Path("config/schemas/bank_profile_schema.json").read_text(encoding="utf-8"))
+    validate = get_pregenerated_validator(schema_digest(schema))
+    assert validate is not None
+
+    profile = copy.deepcopy(triangle_profile)
+    for section in profile["sections"]:
+        section.pop("skip_footer_rows", None)
+    expected = copy.deepcopy(profile)
+    validate(profile)
+    assert profile == expected
+
+def test_pregenerated_validators_are_current():
+    from src._generated.__main__ import main
+
+    assert main(["--check"]) == 0
+
+def test_load_bank_profile_revalidates_after_schema_edit(tmp_path):
+    import os
+    import jsonschema
+
+    profiles_dir = tmp_path / "bank_profiles"
+    profiles_dir.mkdir()
+    (profiles_dir / "sample.json").write_text(json.dumps({"bank_name": "sample"}))
+    schema_file = profiles_dir / "bank_profile_schema.json"
+    schema_file.write_text(json.dumps({"type": "object"}))
+    assert load_bank_profile("sample", profiles_dir=profiles_dir)["bank_name"] == "sample"
+
+    schema_file.write_text(json.dumps({"type": "object", "required": ["statement_type"]}))
+    stat = schema_file.stat()
+    os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    with pytest.raises(jsonschema.ValidationError):
+        load_bank_profile("sample", profiles_dir=profiles_dir)
+
+def test_load_bank_profile_reuses_parse_until_file_changes(tmp_path):
+    profiles_dir = tmp_path / "bank_profiles"
+    profiles_dir.mkdir()
+    profile_file = profiles_dir / "sample.json"
+    profile_file.write_text(json.dumps({"bank_name": "sample"}))
+    (profiles_dir / "bank_profile_schema.json").write_text(json.dumps({"type": "object"}))
+
+    first = load_bank_profile("sample", profiles_dir=profiles_dir)
+    first["bank_name"] = "mutated"
+    assert load_bank_profile("sample", profiles_dir=profiles_dir)["bank_name"] == "sample"
+
+    profile_file.write_text(json.dumps({"bank_name": "renamed bank"}))
+    assert load_bank_profile("sample", profiles_dir=profiles_dir)["bank_name"] == "renamed bank"
+
+def test_load_bank_profile_cache_is_keyed_by_absolute_path(tmp_path, monkeypatch):
+    stamp = None
+    for name in ("first", "second"):
+        profiles_dir = tmp_path / name / "bank_profiles"
+        profiles_dir.mkdir(parents=True)
+        profile_file = profiles_dir / "sample.json"
+        profile_file.write_text(json.dumps({"bank_name": name.ljust(6, "_")}))
+        (profiles_dir / "bank_profile_schema.json").write_text(json.dumps({"type": "object"}))
+        # Same relative path, size and mtime in both trees: only the location differs.
+        stamp = stamp or profile_file.stat().st_mtime_ns
+        os.utime(profile_file, ns=(stamp, stamp))
+        os.utime(profiles_dir / "bank_profile_schema.json", ns=(stamp, stamp))
+
+    relative_dir = Path("bank_profiles")
+    monkeypatch.chdir(tmp_path / "first")
+    assert load_bank_profile("sample", profiles_dir=relative_dir)["bank_name"] == "first_"
+    monkeypatch.chdir(tmp_path / "second")
+    assert load_bank_profile("sample", profiles_dir=relative_dir)["bank_name"] == "second"
+
+def test_profile_validators_are_keyed_by_absolute_schema_path(tmp_path, monkeypatch):
+    from jsonschema import ValidationError
+    from src.utils import _validate_profile
+
+    schemas = {"loose": {"type": "object"}, "strict": {"type": "object", "required": ["bank_name"]}}
+    for name, schema in schemas.items():
+        schema_file = tmp_path / name / "schema.json"
+        schema_file.parent.mkdir()
+        schema_file.write_text(json.dumps(schema))
+        os.utime(schema_file, ns=(1_000_000_000, 1_000_000_000))
+
+    monkeypatch.chdir(tmp_path / "loose")
+    _validate_profile({}, Path("schema.json"))
+    monkeypatch.chdir(tmp_path / "strict")
+    with pytest.raises(ValidationError):
+        _validate_profile({}, Path("schema.json"))
+
+@pytest.mark.parametrize("explicit_base_dir", [True, False], ids=["base_dir", "default_base_dir"])
+def test_setup_paths_success(tmp_path, monkeypatch, explicit_base_dir):
+    # Run from tmp_path so the default "data" base and the "output" dir stay inside it
+    monkeypatch.chdir(tmp_path)
+    base_dir = tmp_path / "statements" if explicit_base_dir else Path("data")
+    year_dir = base_dir / "2025"
+    year_dir.mkdir(parents=True)
     csv_file = year_dir / "account.csv"
     csv_file.write_text("2025-01-01,Deposit,100.00")
 
-    input_dir, output_dir, input_files = setup_paths(2025, base_dir=tmp_path)
+    if explicit_base_dir:
+        input_dir, output_dir, input_files = setup_paths(2025, base_dir=base_dir)
+    else:
+        input_dir, output_dir, input_files = setup_paths(2025)
     assert input_dir.exists()
     assert output_dir.exists()
     assert csv_file in input_files
 
+def test_setup_paths_matches_upper_case_extension(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    year_dir = tmp_path / "2025"
+    year_dir.mkdir()
+    csv_file = year_dir / "STATEMENT.CSV"
+    csv_file.write_text("2025-01-01,Deposit,100.00")
+
+    _, _, input_files = setup_paths(2025, base_dir=tmp_path)
+    assert input_files == [csv_file]
+
+def test_load_bank_profile_fuzzy_match_ignores_extension_case(tmp_path):
+    profiles_dir = tmp_path / "bank_profiles"
+    profiles_dir.mkdir()
+    (profiles_dir / "TD_VISA.JSON").write_text(json.dumps({"bank_name": "td_visa"}))
+    (profiles_dir / "BANK_PROFILE_SCHEMA.JSON").write_text(json.dumps({"type": "object"}))
+    (profiles_dir / "bank_profile_schema.json").write_text(json.dumps({"type": "object"}))
+
+    assert load_bank_profile("visa", profiles_dir=profiles_dir)["bank_name"] == "td_visa"
+    with pytest.raises(FileNotFoundError) as excinfo:
+        load_bank_profile("cibc", profiles_dir=profiles_dir)
+    assert "BANK_PROFILE_SCHEMA" not in str(excinfo.value)
+    assert "TD_VISA" in str(excinfo.value)
+
 def test_setup_paths_no_dir(tmp_path):
     with pytest.raises(FileNotFoundError):
         setup_paths(2099)
@@ -79,4 +219,50 @@ def test_notify_unicode_fallback(monkeypatch):
     str_content = fake_stdout.getvalue()
     bytes_content = fake_buffer.getvalue()
 
-    assert "Test message" in str_content or b"Test message" in bytes_content
\ No newline at end of file
+    assert "Test message" in str_content or b"Test message" in bytes_content
+
+
+def test_notify_keeps_console_encoding_for_unencodable_text(monkeypatch):
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="cp1252", newline="\n")
+    monkeypatch.setattr(sys, "stdout", stream)
+
+    notify("café ✅")
+    notify("second ✅")
+    stream.flush()
+
+    assert stream.encoding == "cp1252"
+    assert raw.getvalue().decode("cp1252") == "café ?\nsecond ?\n"
+
+@pytest.mark.parametrize("value, expected", [(None, True), ("1", True), ("0", False)])
+def test_perf_monitoring_reads_environment(monkeypatch, value, expected):
+    from src.utils import _perf_monitoring_from_env
+
+    if value is None:
+        monkeypatch.delenv("BOOKKEEPING_PERF_MONITORING", raising=False)
+    else:
+        monkeypatch.setenv("BOOKKEEPING_PERF_MONITORING", value)
+    assert _perf_monitoring_from_env() is expected
+
+def test_perf_monitoring_env_leaves_decorated_functions_unwrapped():
+    import subprocess
+
+    code = "import src.utils as u; f = lambda: 1; print(u.perf_monitoring, u.time_it(f) is f)"
+    env = {**os.environ, "BOOKKEEPING_PERF_MONITORING": "0"}
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ["False", "True"]
+
+def test_time_it_skips_wrapper_when_monitoring_already_off(monkeypatch):
+    import src.utils as utils
+
+    def work():
+        return 42
+
+    monkeypatch.setattr(utils, "perf_monitoring", False)
+    assert utils.time_it(work) is work
+
+    monkeypatch.setattr(utils, "perf_monitoring", True)
+    timed = utils.time_it(work)
+    assert timed is not work
+    monkeypatch.setattr(utils, "perf_monitoring", False)
+    assert timed() == 42